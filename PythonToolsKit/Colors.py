@@ -46,6 +46,10 @@ arguments and raises a ValueError when the arguments are invalid. The
 255
 >>> Colors.get_8bits_color(0, 0, 0)
 0
+>>> Colors.html_to_int_many(['#ff0096', '#00FF00'])
+[(255, 0, 150), (0, 255, 0)]
+>>> Colors.int_to_html_many([(255, 0, 150), (0, 255, 0)])
+['#ff0096', '#00ff00']
 >>>
 
 Run tests:
@@ -111,9 +115,187 @@ __copyright__ = copyright
 
 __all__ = ["Colors"]
 
+from typing import Tuple, List, Iterable, Union
 from binascii import b2a_hex, a2b_hex
+from re import compile as re_compile
+from itertools import chain
+from functools import lru_cache
 from decimal import Decimal
-from typing import Tuple
+from sys import executable
+
+try:
+    from numpy import frombuffer, ndarray, uint8
+except ImportError:
+    NUMPY = False
+else:
+    NUMPY = True
+
+html_color = re_compile("#[0-9a-fA-F]{6}")
+not_hexadecimal = re_compile("[^0-9a-fA-F]")
+
+xterm_levels = (0, 95, 135, 175, 215, 255)
+xterm_palette = [
+    (0, 0, 0),
+    (128, 0, 0),
+    (0, 128, 0),
+    (128, 128, 0),
+    (0, 0, 128),
+    (128, 0, 128),
+    (0, 128, 128),
+    (192, 192, 192),
+    (128, 128, 128),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (0, 0, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+]
+xterm_palette.extend(
+    (red, green, blue)
+    for red in xterm_levels
+    for green in xterm_levels
+    for blue in xterm_levels
+)
+xterm_palette.extend((gray, gray, gray) for gray in range(8, 248, 10))
+xterm_level_indexes = bytes(
+    min(range(6), key=lambda index: abs(xterm_levels[index] - value))
+    for value in range(256)
+)
+
+
+def nearest_xterm256(red: int, green: int, blue: int) -> int:
+    """
+    This function returns the nearest xterm 256 colors index
+    (color cube and grayscale, the 16 system colors are
+    configurable so they are not used).
+    """
+
+    red_index = xterm_level_indexes[red]
+    green_index = xterm_level_indexes[green]
+    blue_index = xterm_level_indexes[blue]
+
+    cube_distance = (
+        (xterm_levels[red_index] - red) ** 2
+        + (xterm_levels[green_index] - green) ** 2
+        + (xterm_levels[blue_index] - blue) ** 2
+    )
+
+    gray_index = ((red + green + blue) // 3 - 3) // 10
+    if gray_index < 0:
+        gray_index = 0
+    elif gray_index > 23:
+        gray_index = 23
+
+    gray = 8 + 10 * gray_index
+    gray_distance = (
+        (gray - red) ** 2 + (gray - green) ** 2 + (gray - blue) ** 2
+    )
+
+    if gray_distance < cube_distance:
+        return 232 + gray_index
+
+    return 16 + 36 * red_index + 6 * green_index + blue_index
+
+
+@lru_cache(maxsize=None)
+def get_xterm256_table() -> bytes:
+    """
+    This function returns the lookup table (32768 entries) of
+    xterm 256 colors indexes for RGB colors with 5 bits per
+    channel: table[(red >> 3) << 10 | (green >> 3) << 5 | blue >> 3]
+    """
+
+    values = [(value << 3) | (value >> 2) for value in range(32)]
+    return bytes(
+        nearest_xterm256(red, green, blue)
+        for red in values
+        for green in values
+        for blue in values
+    )
+
+
+def check_colors_many(
+    colors: Union[Iterable[Tuple[int, int, int]], bytes], function: str
+) -> Union[List[Tuple[int, int, int]], bytes, "numpy.ndarray"]:
+    """
+    This function checks many colors (tuples, packed RGB bytes
+    or NumPy array with shape: n, 3) for the Colors function
+    named function, raises ValueError for invalid colors and
+    returns colors (a list for tuples).
+    """
+
+    if isinstance(colors, (bytes, bytearray, memoryview)):
+        size = memoryview(colors).nbytes
+        if size % 3:
+            raise ValueError(
+                f"Colors.{function} packed RGB bytes length "
+                f"should be a multiple of 3 ({size} is invalid)."
+            )
+        return colors
+
+    if NUMPY and isinstance(colors, ndarray):
+        if colors.ndim != 2 or colors.shape[1] != 3:
+            raise ValueError(
+                f"Colors.{function} NumPy array shape should "
+                f"be (n, 3) ({colors.shape!r} is invalid)."
+            )
+        if colors.dtype.kind not in "ui":
+            raise ValueError(
+                f"Colors.{function} NumPy array dtype should "
+                f"be an integer type ({colors.dtype} is invalid)."
+            )
+        if colors.size:
+            minimum = colors.min()
+            maximum = colors.max()
+            if minimum < 0 or maximum > 255:
+                raise ValueError(
+                    f"Colors.{function} NumPy array should "
+                    "contain int between 0 and 255 ("
+                    f"{minimum if minimum < 0 else maximum} is "
+                    "invalid)."
+                )
+        return colors
+
+    colors = list(colors)
+
+    for color in colors:
+        if len(color) != 3 or any(
+            not isinstance(x, int) or x > 255 or x < 0 for x in color
+        ):
+            raise ValueError(
+                f"Colors.{function} arguments should be tuples "
+                f"of 3 int between 0 and 255 ({color!r} is invalid)."
+            )
+
+    return colors
+
+
+def safe_colors_many(
+    colors: Union[Iterable[Tuple[int, int, int]], bytes]
+) -> Union[List[Tuple[int, int, int]], bytes, "numpy.ndarray"]:
+    """
+    This function returns many colors (tuples, packed RGB bytes
+    or NumPy array) with channels modulo 256, invalid channels
+    replaced by 0 and incomplete colors removed or completed.
+    """
+
+    if isinstance(colors, (bytes, bytearray, memoryview)):
+        colors = memoryview(colors).cast("B")
+        return colors[: len(colors) - len(colors) % 3]
+
+    if NUMPY and isinstance(colors, ndarray):
+        if colors.dtype.kind not in "ui":
+            colors = colors.astype("int64")
+        colors = (colors.reshape(-1) % 256).astype(uint8)
+        return colors[: colors.size - colors.size % 3].reshape(-1, 3)
+
+    return [
+        tuple(x % 256 if isinstance(x, int) else 0 for x in color[:3])
+        + (0,) * (3 - len(color[:3]))
+        for color in map(tuple, colors)
+    ]
 
 
 class Colors:
@@ -214,12 +396,7 @@ class Colors:
         >>>
         """
 
-        if (
-            not isinstance(color, str)
-            or len(color) != 7
-            or color[0] != "#"
-            or any(x not in "abcdefABCDEF0123456789" for x in color[1:])
-        ):
+        if not isinstance(color, str) or not html_color.fullmatch(color):
             raise ValueError(
                 "Color should be a hexadecimal "
                 "string of length 7 starting with"
@@ -240,17 +417,7 @@ class Colors:
         >>>
         """
 
-        color_ = "#"
-        for char in color:
-            if char in "abcdefABCDEF0123456789":
-                color_ += char
-
-            if len(color_) >= 7:
-                break
-
-        while len(color_) < 7:
-            color_ += "0"
-
+        color_ = "#" + not_hexadecimal.sub("", color)[:6].ljust(6, "0")
         return Colors.html_to_int(color_)
 
     def html_to_int(colors: str) -> Tuple[int, int, int]:
@@ -266,6 +433,260 @@ class Colors:
 
         return tuple(x for x in a2b_hex(colors[1:].encode()))
 
+    def check_html_to_int_many(
+        colors: Iterable[str], as_array: bool = False
+    ) -> Union[List[Tuple[int, int, int]], "numpy.ndarray"]:
+        """
+        This function performs checks for html_to_int_many
+        arguments and call it.
+
+        >>> Colors.check_html_to_int_many(['#FF0096', '#00ff00'])
+        [(255, 0, 150), (0, 255, 0)]
+        >>> Colors.check_html_to_int_many(['#FF0096', '#ZF0096'])
+        Traceback (most recent call last):
+                ...
+        ValueError: Color should be a hexadecimal string of length 7 starting with '#' ('#ZF0096' is invalid).
+        >>>
+        """
+
+        colors = list(colors)
+        fullmatch = html_color.fullmatch
+
+        for color in colors:
+            if not isinstance(color, str) or not fullmatch(color):
+                raise ValueError(
+                    "Color should be a hexadecimal "
+                    "string of length 7 starting with"
+                    f" '#' ({color!r} is invalid)."
+                )
+
+        return Colors.html_to_int_many(colors, as_array)
+
+    def html_to_bytes_many(colors: Iterable[str]) -> bytes:
+        """
+        This function translates HTML colors to
+        packed RGB bytes (3 bytes per color).
+
+        >>> Colors.html_to_bytes_many(['#FF0096', '#00ff00'])
+        b'\\xff\\x00\\x96\\x00\\xff\\x00'
+        >>>
+        """
+
+        return bytes.fromhex("".join([color[1:] for color in colors]))
+
+    def html_to_int_many(
+        colors: Iterable[str], as_array: bool = False
+    ) -> Union[List[Tuple[int, int, int]], "numpy.ndarray"]:
+        """
+        This function translates HTML colors to integers
+        colors, as_array returns a NumPy array (shape: n, 3).
+
+        >>> Colors.html_to_int_many(['#FF0096', '#00ff00'])
+        [(255, 0, 150), (0, 255, 0)]
+        >>>
+        """
+
+        data = Colors.html_to_bytes_many(colors)
+
+        if as_array:
+            if not NUMPY:
+                raise ImportError(
+                    "NumPy should be installed to use as_array.\n"
+                    f"You can install it with: {executable} -m pip install "
+                    "numpy"
+                )
+            return frombuffer(data, uint8).reshape(-1, 3)
+
+        return list(zip(data[0::3], data[1::3], data[2::3]))
+
+    def check_int_to_html_many(
+        colors: Union[Iterable[Tuple[int, int, int]], bytes]
+    ) -> List[str]:
+        """
+        This function performs checks for int_to_html_many
+        arguments and call it.
+
+        >>> Colors.check_int_to_html_many([(255, 0, 150), (0, 255, 0)])
+        ['#ff0096', '#00ff00']
+        >>> Colors.check_int_to_html_many([(255, 0, 150), (0, 256)])
+        Traceback (most recent call last):
+                ...
+        ValueError: Colors.int_to_html_many arguments should be tuples of 3 int between 0 and 255 ((0, 256) is invalid).
+        >>> Colors.check_int_to_html_many(b'\\xff\\x00\\x96\\x00')
+        Traceback (most recent call last):
+                ...
+        ValueError: Colors.int_to_html_many packed RGB bytes length should be a multiple of 3 (4 is invalid).
+        >>>
+        """
+
+        return Colors.int_to_html_many(
+            check_colors_many(colors, "int_to_html_many")
+        )
+
+    def int_to_html_many(
+        colors: Union[Iterable[Tuple[int, int, int]], bytes]
+    ) -> List[str]:
+        """
+        This function translates integers colors (tuples, packed
+        RGB bytes or NumPy array of uint8) to HTML colors.
+
+        >>> Colors.int_to_html_many([(255, 0, 150), (0, 255, 0)])
+        ['#ff0096', '#00ff00']
+        >>> Colors.int_to_html_many(b'\\xff\\x00\\x96')
+        ['#ff0096']
+        >>>
+        """
+
+        if NUMPY and isinstance(colors, ndarray):
+            data = colors.astype(uint8, copy=False).tobytes()
+        elif isinstance(colors, (bytes, bytearray, memoryview)):
+            data = colors
+        else:
+            data = bytes(chain.from_iterable(colors))
+
+        hexadecimal = data.hex()
+        return [
+            "#" + hexadecimal[index : index + 6]
+            for index in range(0, len(hexadecimal), 6)
+        ]
+
+    def check_rgb_to_xterm256(*args) -> int:
+        """
+        This function performs checks for rgb_to_xterm256
+        arguments and call it.
+
+        >>> Colors.check_rgb_to_xterm256(0, 255, 0)
+        46
+        >>> Colors.check_rgb_to_xterm256(0, 256, 0)
+        Traceback (most recent call last):
+                ...
+        ValueError: Colors.rgb_to_xterm256 arguments should be int between 0 and 255 (256 is invalid).
+        >>>
+        """
+
+        if len(args) != 3:
+            raise ValueError(
+                "Colors.rgb_to_xterm256 should be called with 3 "
+                f"arguments ({len(args)} arguments is invalid)."
+            )
+
+        for arg in args:
+            if not isinstance(arg, int) or arg > 255 or arg < 0:
+                raise ValueError(
+                    "Colors.rgb_to_xterm256 arguments should "
+                    f"be int between 0 and 255 ({arg!r} is invalid)."
+                )
+
+        return Colors.rgb_to_xterm256(*args)
+
+    def safe_rgb_to_xterm256(*args) -> int:
+        """
+        This function performs checks for rgb_to_xterm256
+        arguments and call it.
+
+        >>> Colors.safe_rgb_to_xterm256(0, 255, 0)
+        46
+        >>> Colors.safe_rgb_to_xterm256(300, -1, "invalid")
+        46
+        >>>
+        """
+
+        args_ = [arg % 256 if isinstance(arg, int) else 0 for arg in args]
+        args_.extend(0 for _ in range(3 - len(args_)))
+        return Colors.rgb_to_xterm256(*args_[:3])
+
+    def rgb_to_xterm256(red: int, green: int, blue: int) -> int:
+        """
+        This function returns the nearest xterm 256 colors index
+        (for Terminal.change_foreground_color_8bits) using the
+        precomputed lookup table. Channels should be int between
+        0 and 255 (see check_rgb_to_xterm256), there is no check.
+
+        >>> Colors.rgb_to_xterm256(255, 0, 0)
+        196
+        >>> Colors.rgb_to_xterm256(8, 8, 8)
+        232
+        >>>
+        """
+
+        return get_xterm256_table()[
+            (red >> 3) << 10 | (green >> 3) << 5 | blue >> 3
+        ]
+
+    def check_rgb_to_xterm256_many(
+        colors: Union[Iterable[Tuple[int, int, int]], bytes]
+    ) -> Union[bytes, "numpy.ndarray"]:
+        """
+        This function performs checks for rgb_to_xterm256_many
+        arguments and call it.
+
+        >>> Colors.check_rgb_to_xterm256_many([(255, 0, 0), (8, 8, 8)])
+        b'\\xc4\\xe8'
+        >>> Colors.check_rgb_to_xterm256_many([(300, 0, 0)])
+        Traceback (most recent call last):
+                ...
+        ValueError: Colors.rgb_to_xterm256_many arguments should be tuples of 3 int between 0 and 255 ((300, 0, 0) is invalid).
+        >>>
+        """
+
+        return Colors.rgb_to_xterm256_many(
+            check_colors_many(colors, "rgb_to_xterm256_many")
+        )
+
+    def safe_rgb_to_xterm256_many(
+        colors: Union[Iterable[Tuple[int, int, int]], bytes]
+    ) -> Union[bytes, "numpy.ndarray"]:
+        """
+        This function performs checks for rgb_to_xterm256_many
+        arguments and call it.
+
+        >>> Colors.safe_rgb_to_xterm256_many([(255, 0, 0), (300, -1, "a")])
+        b'\\xc4.'
+        >>> Colors.safe_rgb_to_xterm256_many(b'\\xff\\x00\\x00\\x08')
+        b'\\xc4'
+        >>>
+        """
+
+        return Colors.rgb_to_xterm256_many(safe_colors_many(colors))
+
+    def rgb_to_xterm256_many(
+        colors: Union[Iterable[Tuple[int, int, int]], bytes]
+    ) -> Union[bytes, "numpy.ndarray"]:
+        """
+        This function returns the nearest xterm 256 colors indexes
+        for colors (tuples, packed RGB bytes or NumPy array of uint8
+        with shape: n, 3), a NumPy array is returned for a NumPy
+        array. Channels should be int between 0 and 255 (see
+        check_rgb_to_xterm256_many), there is no check.
+
+        >>> Colors.rgb_to_xterm256_many([(255, 0, 0), (8, 8, 8)])
+        b'\\xc4\\xe8'
+        >>>
+        """
+
+        table = get_xterm256_table()
+
+        if NUMPY and isinstance(colors, ndarray):
+            colors = colors.astype(uint8, copy=False).reshape(-1, 3)
+            indexes = (
+                (colors[:, 0].astype("uint16") >> 3) << 10
+                | (colors[:, 1].astype("uint16") >> 3) << 5
+                | colors[:, 2] >> 3
+            )
+            return frombuffer(table, uint8)[indexes]
+
+        if not isinstance(colors, (bytes, bytearray, memoryview)):
+            colors = bytes(chain.from_iterable(colors))
+
+        return bytes(
+            [
+                table[(red >> 3) << 10 | (green >> 3) << 5 | blue >> 3]
+                for red, green, blue in zip(
+                    colors[0::3], colors[1::3], colors[2::3]
+                )
+            ]
+        )
+
     def check_rgb_to_int(color: str) -> Tuple[int, int, int]:
         """
         This function performs checks for rgb_to_int
@@ -291,6 +291,15 @@ statistictype(key='level', value=3)
 |1   |2   |
 |2   |1   |
 |2   |1   |
+>>> DataAnalysis.print_stream(data, {"key1": "Column name"}, sample_size=2)
+|Column name|key2|
+|-----------|----|
+|1          |2   |
+|1          |2   |
+|1          |2   |
+|2          |1   |
+|2          |1   |
+5
 >>> analysis = DataAnalysis(data)
 >>> analysis.statistictypes_printer(analysis.get_deviations())
 |key                    |value              |
@@ -385,11 +394,18 @@ from typing import Dict, TypeVar, List, Tuple, Union, Any
 from collections.abc import Hashable, Iterable, Callable
 from collections import defaultdict, namedtuple, Counter
 from statistics import fmean, median, pstdev, variance
+from typing import TextIO
+from itertools import chain, islice
 from functools import partial
 from datetime import datetime
 from operator import gt, lt
 from sys import argv
 
+if __package__:
+    from .StringF import stream_tableformat
+else:
+    from StringF import stream_tableformat
+
 try:
     from matplotlib.pyplot import bar, show, title
 except ImportError:
@@ -1173,6 +1189,47 @@ class DataAnalysis:
             for element in data:
                 print(get_row(element))
 
+    @staticmethod
+    def print_stream(
+        data: Iterable[Union[Dict[Hashable, Value]], Iterable[Value]],
+        headers: Dict[Hashable, str] = {},
+        file: TextIO = None,
+        sample_size: int = 100,
+        **kwargs,
+    ) -> int:
+        """
+        This function prints data lazily and returns the
+        number of rows.
+
+        The columns widths are computed from the headers
+        and the first sample_size elements.
+
+        **kwargs are sent to StringF.stream_tableformat
+        """
+
+        get_iterator_tuples = DataAnalysis.get_iterator_tuples
+        data = iter(data)
+        sample = list(islice(data, sample_size))
+
+        if not sample:
+            return 0
+
+        get = headers.get
+        columns = [
+            str(get(key, key)) for key, _ in get_iterator_tuples(sample[0])
+        ]
+
+        return stream_tableformat(
+            (
+                [value for _, value in get_iterator_tuples(element)]
+                for element in chain(sample, data)
+            ),
+            file,
+            columns,
+            sample_size,
+            **kwargs,
+        )
+
     @staticmethod
     def statistictypes_chart(
         data: Iterable[statistictype],
@@ -51,6 +51,9 @@ Problem and soluce using python:
 True
 >>> ("‚ˆƒ", "cp437", "cp1252") in [(work.decoded_values, work.encoding, work.decoding) for x in works.values() for work in x if work.encoding.startswith('cp') and work.decoding.startswith('cp')]
 True
+>>> matchs, works = debug_encoding('éêâ', '‚ˆƒ', first_match=True)
+>>> len(matchs)
+1
 >>> 
 
 Soluce using PowerShell:
@@ -403,18 +406,33 @@ under certain conditions.
 __license__ = license
 __copyright__ = copyright
 
-__all__ = ["debug_encoding"]
+__all__ = ["debug_encoding", "reverse_encoding", "debug_file_encoding"]
 
 print(copyright)
 
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    TimeoutError as FutureTimeoutError,
+    as_completed,
+)
+from typing import Dict, List, Tuple, Iterable, Set, BinaryIO
+from unicodedata import category, name
 from argparse import ArgumentParser, Namespace
+from sys import exit, stdout, stdin, version_info
+from codecs import charmap_decode, getincrementaldecoder
 from encodings.aliases import aliases
-from typing import Dict, List, Tuple
+from importlib import import_module
 from collections import defaultdict
+from json import dump, load, JSONDecodeError
 from dataclasses import dataclass
 from contextlib import suppress
-from sys import exit, stdout
-from json import dump
+from functools import lru_cache
+from random import randrange
+from bisect import insort
+from time import perf_counter
+from os import environ
+from pathlib import Path
 
 
 @dataclass
@@ -431,14 +449,191 @@ class WorkingEncoding:
     bad_values: str
 
 
+@dataclass
+class ReverseCandidate:
+
+    """
+    This dataclass stores a candidate original value found
+    from bad values, chains are lists of (encoding, decoding)
+    steps (in forward order) producing the bad values.
+    """
+
+    values: str
+    chains: List[Tuple[Tuple[str, str], ...]]
+    score: float
+
+
+def get_tables_path() -> Path:
+    """
+    This function returns the path of the persisted
+    single-byte codecs tables for this Python version.
+    """
+
+    cache = environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return (
+        Path(cache)
+        / "PythonToolsKit"
+        / f"DebugEncoding-tables-{version_info[0]}.{version_info[1]}.json"
+    )
+
+
+def build_single_byte_tables() -> Dict[str, str]:
+    """
+    This function returns the 256 characters decoding table
+    ("\\ufffe" for undefined bytes) of each single-byte codec.
+    """
+
+    tables = {
+        "latin_1": "".join(map(chr, range(256))),
+        "ascii": "".join(map(chr, range(128))) + "\ufffe" * 128,
+    }
+
+    for codec in set(aliases.values()):
+        try:
+            module = import_module("encodings." + codec)
+        except ImportError:
+            continue
+
+        table = getattr(module, "decoding_table", None)
+        if isinstance(table, str) and len(table) == 256:
+            tables[codec] = table
+
+    return tables
+
+
+@lru_cache(maxsize=None)
+def get_single_byte_tables() -> Dict[str, str]:
+    """
+    This function returns single-byte codecs decoding tables,
+    tables are loaded from the disk cache or built and saved.
+    """
+
+    path = get_tables_path()
+
+    with suppress(OSError, JSONDecodeError):
+        with open(path, encoding="utf-8") as file:
+            return load(file)
+
+    tables = build_single_byte_tables()
+
+    with suppress(OSError):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            dump(tables, file)
+
+    return tables
+
+
+def group_decodings(
+    decodings: Iterable[str],
+) -> List[Tuple[List[str], str]]:
+    """
+    This function groups single-byte decodings with identical
+    tables and returns (decodings, table) tuples, table is
+    None for other decodings.
+    """
+
+    tables = get_single_byte_tables()
+    groups = defaultdict(list)
+    others = []
+
+    for decoding in decodings:
+        table = tables.get(decoding)
+        if table is None:
+            others.append(([decoding], None))
+        else:
+            groups[table].append(decoding)
+
+    return [(group, table) for table, group in groups.items()] + others
+
+
+def encode_values(
+    values_to_test: str, encodings: Iterable[str]
+) -> Dict[bytes, List[str]]:
+    """
+    This function encodes values once per encoding and
+    groups encodings producing identical bytes.
+    """
+
+    groups = defaultdict(list)
+
+    for encoding in encodings:
+        with suppress(UnicodeEncodeError, LookupError):
+            groups[values_to_test.encode(encoding)].append(encoding)
+
+    return groups
+
+
+def decode_values(
+    decoding: str, datas: List[bytes]
+) -> List[Tuple[int, str]]:
+    """
+    This function decodes each distinct bytes once and
+    returns (index, decoded values) for working decodings.
+    """
+
+    decoded = []
+    append = decoded.append
+
+    for index, data in enumerate(datas):
+        try:
+            append((index, data.decode(decoding)))
+        except UnicodeDecodeError:
+            pass
+        except LookupError:
+            return decoded
+
+    return decoded
+
+
+def decode_table_values(
+    table: str, datas: List[bytes]
+) -> List[Tuple[int, str]]:
+    """
+    This function decodes each distinct bytes with a single-byte
+    decoding table and returns (index, decoded values).
+    """
+
+    decoded = []
+    append = decoded.append
+
+    for index, data in enumerate(datas):
+        with suppress(UnicodeDecodeError):
+            append((index, charmap_decode(data, "strict", table)[0]))
+
+    return decoded
+
+
+def decode_group(
+    group: Tuple[List[str], str], datas: List[bytes]
+) -> List[Tuple[int, str]]:
+    """
+    This function decodes each distinct bytes once
+    for a group of equivalent decodings.
+    """
+
+    decodings, table = group
+
+    if table is None:
+        return decode_values(decodings[0], datas)
+
+    return decode_table_values(table, datas)
+
+
 def debug_encoding(
     values_to_test: str,
     bad_values: str = None,
     encoding: str = None,
     decoding: str = None,
+    first_match: bool = False,
 ) -> Tuple[List[WorkingEncoding], Dict[str, List[WorkingEncoding]]]:
     """
     This function helps developers to debug encodings.
+
+    Values are encoded once per encoding, identical bytes are
+    decoded once per decoding (once per group of single-byte
+    decodings with identical tables), first_match stops on the
+    first bad_values match.
     """
 
     working_encodings = defaultdict(list)
@@ -452,20 +647,524 @@ def debug_encoding(
     if decoding:
         decodings = (decoding,)
 
-    for encoding in encodings:
-        for decoding in decodings:
-            if encoding == decoding:
+    groups = encode_values(values_to_test, encodings)
+    datas = list(groups)
+    encodings_groups = list(groups.values())
+    decodings_groups = group_decodings(decodings)
+
+    for decodings, table in decodings_groups:
+        for index, values in decode_group((decodings, table), datas):
+            for decoding in decodings:
+                for encoding in encodings_groups[index]:
+                    if encoding == decoding:
+                        continue
+
+                    working = WorkingEncoding(
+                        encoding, decoding, values, bad_values
+                    )
+                    working_encodings[values].append(working)
+
+                    if values == bad_values:
+                        matching_encodings.append(working)
+                        if first_match:
+                            return matching_encodings, working_encodings
+
+    return matching_encodings, working_encodings
+
+
+invalid_categories = {"Cc", "Cf", "Cn", "Co", "Cs"}
+symbols_categories = {"Sc", "Sk", "Sm", "So", "Mn", "Me"}
+common_codecs = {
+    "utf_8": 0.5,
+    "cp1252": 0.25,
+    "latin_1": 0.25,
+    "cp437": 0.25,
+    "cp850": 0.25,
+    "cp1251": 0.125,
+    "iso8859_15": 0.125,
+    "utf_16_le": 0.125,
+    "mac_roman": 0.125,
+}
+
+
+def is_valid_values(values: str) -> bool:
+    """
+    This function returns False when values contain control,
+    unassigned, private or surrogate characters (pruned).
+    """
+
+    return not any(
+        category(character) in invalid_categories
+        for character in set(values)
+        if character not in "\t\n\r"
+    )
+
+
+def get_ascii(values: str) -> str:
+    """
+    This function returns ASCII characters from values.
+    """
+
+    return "".join(character for character in values if character.isascii())
+
+
+def plausibility(values: str, bad_values: str = None) -> float:
+    """
+    This function returns a plausibility score for text values:
+    letters, digits and spaces are good, symbols, controls, combining
+    marks, non-ASCII characters and mixed scripts are penalised. Most
+    mojibakes keep ASCII characters, when bad_values is set values
+    with different ASCII characters are penalised.
+
+    >>> plausibility("été") > plausibility("Ã©tÃ©")
+    True
+    >>> plausibility("abc")
+    1.0
+    >>> plausibility("abc", "xyz")
+    0.0
+    """
+
+    if not values:
+        return 0.0
+
+    score = 0.0
+    scripts = set()
+
+    for character in values:
+        if character.isascii():
+            score += character.isalnum() or character in " \t\n\r.,'-"
+            if character.isalpha():
+                scripts.add("LATIN")
+            continue
+
+        code = category(character)
+        if code[0] == "L":
+            score += 0.75
+            scripts.add(name(character, "").split(" ", 1)[0])
+        elif code in symbols_categories or code in invalid_categories:
+            score -= 1
+        elif code[0] in "NZ":
+            score += 0.5
+
+    score = score / len(values) - 0.25 * max(len(scripts) - 1, 0)
+
+    if bad_values is not None and get_ascii(values) != get_ascii(bad_values):
+        score -= 1
+
+    return score
+
+
+def chain_prior(chain: Tuple[Tuple[str, str], ...]) -> float:
+    """
+    This function returns the average prior of a chain using
+    common codecs (UTF-8 decoding is a strong validation),
+    the best chains are the first chains of each candidate.
+    """
+
+    return sum(
+        common_codecs.get(encoding, 0) + common_codecs.get(decoding, 0) / 2
+        for encoding, decoding in chain
+    ) / len(chain)
+
+
+def get_groups_characters(
+    groups: List[Tuple[List[str], str]]
+) -> List[Set[str]]:
+    """
+    This function returns the set of valid characters for each
+    single-byte group (None for others) used to prune encodings.
+    """
+
+    return [
+        None if table is None else set(table) - {"\ufffe"}
+        for _, table in groups
+    ]
+
+
+def reverse_values(
+    values: str,
+    decoding_group: Tuple[List[str], str],
+    encodings_groups: List[Tuple[List[str], str]],
+) -> List[Tuple[str, str, str]]:
+    """
+    This function reverses one step for the values: values are
+    encoded with the (wrong) decoding, then the bytes are decoded
+    with each encoding group. Returns (encoding, decoding, values).
+    """
+
+    decodings, table = decoding_group
+
+    try:
+        data = values.encode(decodings[0])
+    except (UnicodeEncodeError, LookupError):
+        return []
+
+    datas = [data]
+    reversed_ = []
+    append = reversed_.append
+
+    for group in encodings_groups:
+        for _, decoded in decode_group(group, datas):
+            if decoded == values or not is_valid_values(decoded):
                 continue
-            with suppress(UnicodeEncodeError, LookupError, UnicodeDecodeError):
-                values = values_to_test.encode(encoding).decode(decoding)
-                working = WorkingEncoding(
-                    encoding, decoding, values, bad_values
+            for encoding in group[0]:
+                for decoding in decodings:
+                    if encoding != decoding:
+                        append((encoding, decoding, decoded))
+
+    return reversed_
+
+
+def reverse_encoding(
+    bad_values: str,
+    max_depth: int = 2,
+    timeout: float = 5.0,
+    workers: int = None,
+    processes: bool = False,
+    encodings: Iterable[str] = None,
+    max_chains: int = 16,
+) -> List[ReverseCandidate]:
+    """
+    This function searches original values from bad values only,
+    using a breadth-first search over (encoding, decoding) chains
+    (max_depth steps for multiple wrong encodings).
+
+    Intermediate values are memoised (each values is expanded once),
+    decodings unable to encode the values and values containing
+    invalid characters are pruned. Candidates are scored when found
+    and the search stops after timeout seconds (the best candidates
+    found so far are returned), workers threads (processes if
+    processes is True) are used to expand values. Only the max_chains
+    best chains are kept per values. Candidates are sorted by
+    plausibility (characters, common codecs and number of steps).
+
+    >>> candidates = reverse_encoding("Ã©tÃ©", max_depth=1)
+    >>> candidates[0].values
+    'été'
+    >>> candidates[0].chains[0]
+    (('utf_8', 'cp1252'),)
+    >>> candidates = reverse_encoding("ÃƒÂ©tÃƒÂ©", timeout=30)
+    >>> candidates[0].values, candidates[0].chains[0]
+    ('été', (('utf_8', 'cp1252'), ('utf_8', 'cp1252')))
+    >>> candidates = reverse_encoding("‚ˆƒ", max_depth=1, workers=2)
+    >>> candidates[0].values, candidates[0].chains[0]
+    ('éêâ', (('cp437', 'cp1252'),))
+    >>> 
+    """
+
+    groups = group_decodings(encodings or set(aliases.values()))
+    characters = get_groups_characters(groups)
+    deadline = perf_counter() + timeout
+
+    chains = {bad_values: [(0, ())]}
+    depths = {bad_values: 0}
+    counts = {bad_values: 1}
+    scores = {}
+    frontier = [bad_values]
+
+    executor = (
+        (ProcessPoolExecutor if processes else ThreadPoolExecutor)(workers)
+        if workers
+        else None
+    )
+    futures = ()
+
+    try:
+        for depth in range(1, max_depth + 1):
+            tasks = [
+                (values, group)
+                for values in frontier
+                for group, group_characters in zip(groups, characters)
+                if group_characters is None
+                or group_characters.issuperset(values)
+            ]
+
+            if executor:
+                submit = executor.submit
+                futures = {
+                    submit(reverse_values, values, group, groups): values
+                    for values, group in tasks
+                }
+                results = (
+                    (futures[future], future.result())
+                    for future in as_completed(
+                        futures, max(deadline - perf_counter(), 0)
+                    )
+                )
+            else:
+                results = (
+                    (values, reverse_values(values, group, groups))
+                    for values, group in tasks
+                    if perf_counter() < deadline
                 )
-                working_encodings[values].append(working)
-                if values == bad_values:
-                    matching_encodings.append(working)
 
-    return matching_encodings, working_encodings
+            frontier = []
+            try:
+                for values, reversed_ in results:
+                    for encoding, decoding, decoded in reversed_:
+                        decoded_depth = depths.setdefault(decoded, depth)
+                        if decoded_depth != depth:
+                            continue
+
+                        if decoded not in chains:
+                            if perf_counter() >= deadline:
+                                raise TimeoutError
+                            chains[decoded] = []
+                            counts[decoded] = 0
+                            scores[decoded] = plausibility(
+                                decoded, bad_values
+                            )
+                            frontier.append(decoded)
+
+                        step = ((encoding, decoding),)
+                        decoded_chains = chains[decoded]
+                        counts[decoded] += counts[values]
+                        for _, chain in chains[values]:
+                            chain = step + chain
+                            key = (-chain_prior(chain), chain)
+                            if len(decoded_chains) < max_chains:
+                                insort(decoded_chains, key)
+                            elif key < decoded_chains[-1]:
+                                decoded_chains.pop()
+                                insort(decoded_chains, key)
+            except (TimeoutError, FutureTimeoutError):
+                break
+
+            if perf_counter() >= deadline:
+                break
+    finally:
+        if executor:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    candidates = []
+
+    for values, score in scores.items():
+        values_chains = chains[values]
+        prior, best_chain = values_chains[0]
+        candidates.append(
+            ReverseCandidate(
+                values,
+                [chain for _, chain in values_chains],
+                score - prior - 0.25 * (len(best_chain) - 1),
+            )
+        )
+
+    candidates.sort(key=lambda x: (-x.score, -counts[x.values], x.values))
+    return candidates
+
+
+@dataclass
+class DecodingScore:
+
+    """
+    This dataclass stores the score of a decoding
+    evaluated on sampled lines of a file.
+    """
+
+    decoding: str
+    score: float
+    errors: int
+    sample: str
+    unusual: int = 0
+
+
+def sample_lines(
+    file: BinaryIO, size: int = 1000, max_bytes: int = 8388608
+) -> List[bytes]:
+    """
+    This function returns a reservoir sample of size lines
+    containing non-ASCII bytes, reading max_bytes (0 to read
+    the whole file) line by line in constant memory.
+
+    >>> from io import BytesIO
+    >>> sample_lines(BytesIO(b"abc\\n\\xc3\\xa9t\\xc3\\xa9\\ndef\\n"))
+    [b'\\xc3\\xa9t\\xc3\\xa9\\n']
+    >>> len(sample_lines(BytesIO(b"\\xe9\\n" * 5000), 100))
+    100
+    >>> 
+    """
+
+    reservoir = []
+    append = reservoir.append
+    readed = 0
+    seen = 0
+
+    for line in file:
+        readed += len(line)
+
+        if not line.isascii():
+            if seen < size:
+                append(line)
+            else:
+                index = randrange(seen + 1)
+                if index < size:
+                    reservoir[index] = line
+            seen += 1
+
+        if max_bytes and readed >= max_bytes:
+            break
+
+    return reservoir
+
+
+def count_unusual(values: str) -> int:
+    """
+    This function counts unusual characters in values: non-ASCII
+    symbols, controls and uppercase letters following a lowercase
+    letter (frequent in mojibakes, "PrÛt" for "Prêt").
+
+    >>> count_unusual("Prêt"), count_unusual("PrÛt"), count_unusual("50€")
+    (0, 1, 1)
+    >>> 
+    """
+
+    unusual = 0
+    previous = ""
+
+    for character in values:
+        if not character.isascii():
+            if character.isupper():
+                unusual += previous.islower()
+            elif category(character)[0] not in "LNZ":
+                unusual += 1
+        previous = character
+
+    return unusual
+
+
+def evaluate_decoding(
+    group: Tuple[List[str], str], lines: List[bytes]
+) -> Tuple[float, int, str, int]:
+    """
+    This function decodes each line with a final call of an
+    incremental decoder (lines are not contiguous) or with the
+    single-byte table and returns the average plausibility, the
+    number of errors, a decoded sample and the number of unusual
+    characters (see count_unusual).
+
+    >>> evaluate_decoding((["utf_8"], None), [b"\\xc3", b"\\xa9t\\xc3\\xa9"])
+    (0.0, 2, '', 0)
+    >>> evaluate_decoding((["utf_8"], None), [b"\\xc3\\xa9t\\xc3\\xa9"])[1:]
+    (0, 'été', 0)
+    >>> 
+    """
+
+    decodings, table = group
+
+    if table is None:
+        try:
+            with suppress(UnicodeError):
+                b"0".decode(decodings[0])
+            decoder = getincrementaldecoder(decodings[0])("strict")
+        except LookupError:
+            return None
+
+        def decode(data: bytes) -> str:
+            return decoder.decode(data, True)
+
+    else:
+
+        def decode(data: bytes) -> str:
+            return charmap_decode(data, "strict", table)[0]
+
+    score = 0.0
+    errors = 0
+    unusual = 0
+    sample = ""
+
+    for line in lines:
+        try:
+            values = decode(line)
+        except UnicodeError:
+            errors += 1
+            if table is None:
+                decoder.reset()
+            continue
+
+        score += plausibility(values)
+        unusual += count_unusual(values)
+        if not sample and not values.isascii():
+            sample = values.strip()
+
+    if errors == len(lines):
+        return 0.0, errors, sample, unusual
+
+    return score / (len(lines) - errors), errors, sample, unusual
+
+
+def debug_file_encoding(
+    file: BinaryIO,
+    size: int = 1000,
+    max_bytes: int = 8388608,
+    decoding: str = None,
+    workers: int = None,
+) -> List[DecodingScore]:
+    """
+    This function samples lines with non-ASCII bytes from a
+    binary file (see sample_lines) and ranks decodings by
+    plausibility of the decoded lines, common codecs and errors,
+    ties are broken by the number of unusual characters.
+
+    >>> from io import BytesIO
+    >>> scores = debug_file_encoding(BytesIO("Prêt\\nété\\n".encode()))
+    >>> scores[0].decoding, scores[0].errors, scores[0].sample
+    ('utf_8', 0, 'Prêt')
+    >>> scores = debug_file_encoding(BytesIO("Prêt\\n".encode("cp437")))
+    >>> "cp437" in [score.decoding for score in scores[:3]]
+    True
+    >>> scores = debug_file_encoding(BytesIO("Café crème\\n".encode("cp1252")))
+    >>> [(score.decoding, score.unusual) for score in scores[:3]]
+    [('cp1252', 0), ('latin_1', 0), ('cp850', 2)]
+    >>> 
+    """
+
+    lines = sample_lines(file, size, max_bytes)
+    if not lines:
+        return []
+
+    groups = group_decodings(
+        (decoding,) if decoding else set(aliases.values())
+    )
+    executor = ProcessPoolExecutor(workers) if workers else None
+    futures = ()
+
+    try:
+        if executor:
+            submit = executor.submit
+            futures = [
+                submit(evaluate_decoding, group, lines) for group in groups
+            ]
+            results = (future.result() for future in futures)
+        else:
+            results = (evaluate_decoding(group, lines) for group in groups)
+
+        scores = []
+        for (decodings, _), result in zip(groups, results):
+            if result is None:
+                continue
+
+            score, errors, sample, unusual = result
+            score -= errors / len(lines)
+            scores.extend(
+                DecodingScore(
+                    decoding,
+                    score + common_codecs.get(decoding, 0),
+                    errors,
+                    sample,
+                    unusual,
+                )
+                for decoding in decodings
+            )
+    finally:
+        if executor:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    scores.sort(key=lambda x: (-x.score, x.unusual, x.decoding))
+    return scores
 
 
 def parse_args() -> Namespace:
@@ -496,8 +1195,125 @@ def parse_args() -> Namespace:
     parser.add_argument(
         "--json", "-j", action="store_true", help="JSON output."
     )
-    parser.add_argument("value_to_test")
-    return parser.parse_args()
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="Number of workers to reverse bad values or rank decodings.",
+    )
+    parser.add_argument(
+        "--first-match",
+        "-f",
+        action="store_true",
+        help="Stop on the first encoding matching bad values.",
+    )
+    parser.add_argument(
+        "--reverse",
+        "-r",
+        action="store_true",
+        help="Search original values from bad values (value_to_test).",
+    )
+    parser.add_argument(
+        "--depth",
+        "-D",
+        type=int,
+        default=2,
+        help="Maximum number of wrong encodings to reverse.",
+    )
+    parser.add_argument(
+        "--timeout",
+        "-t",
+        type=float,
+        default=5.0,
+        help="Time budget (in seconds) to reverse bad values.",
+    )
+    parser.add_argument(
+        "--processes",
+        "-p",
+        action="store_true",
+        help="Use processes instead of threads to reverse bad values.",
+    )
+    parser.add_argument(
+        "--file",
+        "-F",
+        help="Rank decodings using lines of this file ('-' for stdin).",
+    )
+    parser.add_argument(
+        "--sample-size",
+        "-s",
+        type=int,
+        default=1000,
+        help="Number of sampled lines containing non-ASCII bytes.",
+    )
+    parser.add_argument(
+        "--max-size",
+        "-m",
+        type=int,
+        default=8388608,
+        help="Maximum number of bytes to read from the file (0: no limit).",
+    )
+    parser.add_argument("value_to_test", nargs="?")
+    arguments = parser.parse_args()
+
+    if arguments.value_to_test is None and arguments.file is None:
+        parser.error("value_to_test or --file is required")
+
+    return arguments
+
+
+def print_scores(scores: List[DecodingScore], json: bool) -> int:
+    """
+    This function prints decodings scores.
+    """
+
+    if json:
+        dump([score.__dict__ for score in scores], stdout, indent=4)
+        return 0
+
+    print(
+        "\n".join(
+            f"Decoding: {score.decoding!r}, Score: {score.score:.3f}, "
+            f"Errors: {score.errors}, Sample: {score.sample[:50]!r}"
+            for score in scores
+        )
+    )
+    return 0
+
+
+def print_candidates(
+    candidates: List[ReverseCandidate], json: bool
+) -> int:
+    """
+    This function prints reversed candidates.
+    """
+
+    if json:
+        dump(
+            [
+                {
+                    "values": candidate.values,
+                    "score": candidate.score,
+                    "chains": candidate.chains,
+                }
+                for candidate in candidates
+            ],
+            stdout,
+            indent=4,
+        )
+        return 0
+
+    print(
+        "\n".join(
+            f"Values: {candidate.values!r}, Score: {candidate.score:.3f}, "
+            "Chain: "
+            + " -> ".join(
+                f"Encoding: {encoding!r}, Decoding: {decoding!r}"
+                for encoding, decoding in candidate.chains[0]
+            )
+            for candidate in candidates
+        )
+    )
+    return 0
 
 
 def main() -> int:
@@ -506,11 +1322,43 @@ def main() -> int:
     """
 
     arguments = parse_args()
+
+    if arguments.file:
+        if arguments.file == "-":
+            file = stdin.buffer
+        else:
+            file = open(arguments.file, "rb")
+
+        with file:
+            return print_scores(
+                debug_file_encoding(
+                    file,
+                    arguments.sample_size,
+                    arguments.max_size,
+                    arguments.decoding,
+                    arguments.workers,
+                ),
+                arguments.json,
+            )
+
+    if arguments.reverse:
+        return print_candidates(
+            reverse_encoding(
+                arguments.value_to_test,
+                arguments.depth,
+                arguments.timeout,
+                arguments.workers,
+                arguments.processes,
+            ),
+            arguments.json,
+        )
+
     matching_encodings, working_encodings = debug_encoding(
         arguments.value_to_test,
         arguments.bad_values,
         arguments.encoding,
         arguments.decoding,
+        arguments.first_match,
     )
 
     if matching_encodings:
@@ -115,6 +115,8 @@ __copyright__ = copyright
 __all__ = [
     "get_encodings",
     "decode_data",
+    "detect_encoding",
+    "decode_stream",
     "b64encode",
     "b64decode",
     "standard_b64encode",
@@ -127,14 +129,24 @@ __all__ = [
     "b64decode_lines",
     "urlsafe_b64encode",
     "urlsafe_b64decode",
+    "b64encode_stream",
+    "b64decode_stream",
+    "b16encode_stream",
+    "b16decode_stream",
+    "write_stream",
 ]
 
 from binascii import b2a_base64, a2b_base64, unhexlify, hexlify
+from typing import BinaryIO, Callable, Iterable, Iterator, List, Tuple
+from codecs import getincrementaldecoder, lookup
+from functools import partial, lru_cache
 from base64 import encode, decode, decodebytes, encodebytes
+from concurrent.futures import ThreadPoolExecutor
 from locale import getpreferredencoding
 from contextlib import suppress
+from collections import deque
+from itertools import chain, repeat
 from os import device_encoding
-from functools import partial
 
 
 def get_encodings():
@@ -159,7 +171,93 @@ def get_encodings():
     yield "latin-1"  # Can read all files
 
 
-def decode_data(data: bytes) -> str:
+@lru_cache(maxsize=None)
+def get_candidate_encodings() -> Tuple[str, ...]:
+    """
+    This function returns the probable encodings without
+    duplicates (computed once).
+
+    >>> get_candidate_encodings()[-2:]
+    ('cp1252', 'latin-1')
+    >>>
+    """
+
+    encodings = {}
+    for encoding in get_encodings():
+        with suppress(LookupError):
+            encodings.setdefault(lookup(encoding).name, encoding)
+
+    return tuple(encodings.values())
+
+
+def incremental_decode(
+    data: bytes,
+    encoding: str,
+    final: bool = True,
+    keep: bool = True,
+    chunk_size: int = 65536,
+) -> List[str]:
+    """
+    This function decodes data by chunks with an incremental decoder
+    (stops on the first invalid chunk) and returns the decoded chunks
+    (empty when keep is False) or None when data cannot be decoded.
+    """
+
+    decode = getincrementaldecoder(encoding)().decode
+    view = memoryview(data)
+    chunks = []
+
+    try:
+        for index in range(0, len(view), chunk_size):
+            chunk = decode(view[index : index + chunk_size])
+            if keep:
+                chunks.append(chunk)
+        if final:
+            chunk = decode(b"", True)
+            if keep:
+                chunks.append(chunk)
+    except UnicodeDecodeError:
+        return None
+
+    return chunks
+
+
+def get_sampled_encodings(sample: bytes) -> List[str]:
+    """
+    This function returns probable encodings
+    able to decode the prefix sample.
+
+    >>> get_sampled_encodings(b"\\xe9t\\xe9")[-2:]
+    ['cp1252', 'latin-1']
+    >>>
+    """
+
+    return [
+        encoding
+        for encoding in get_candidate_encodings()
+        if incremental_decode(sample, encoding, False, False) is not None
+    ]
+
+
+def detect_encoding(data: bytes, sample_size: int = 65536) -> str:
+    """
+    This function returns the first probable encoding able to decode
+    data, candidates are validated on a prefix sample first and
+    data is decoded by chunks to find failures early.
+
+    >>> detect_encoding("été".encode())
+    'utf-8'
+    >>> detect_encoding("é".encode() * 10 + b"\\x81", 4)
+    'latin-1'
+    >>>
+    """
+
+    for encoding in get_sampled_encodings(data[:sample_size]):
+        if incremental_decode(data, encoding, keep=False) is not None:
+            return encoding
+
+
+def decode_data(data: bytes, sample_size: int = 65536) -> str:
     """
     This function decodes data (try some encodings).
 
@@ -168,11 +266,55 @@ def decode_data(data: bytes) -> str:
     >>>
     """
 
-    output = None
-    for encoding in get_encodings():
-        with suppress(UnicodeDecodeError):
-            output = data.decode(encoding)
-            return output
+    for encoding in get_sampled_encodings(data[:sample_size]):
+        chunks = incremental_decode(data, encoding)
+        if chunks is not None:
+            return "".join(chunks)
+
+
+def decode_stream(
+    file: BinaryIO, sample_size: int = 65536, chunk_size: int = 65536
+) -> Iterator[str]:
+    """
+    This function decodes a large binary file line by line, the
+    encoding is detected on the first sample_size bytes; when a
+    following chunk cannot be decoded, the next probable encoding
+    able to decode it is used.
+
+    >>> from io import BytesIO
+    >>> list(decode_stream(BytesIO("été\\nPrêt\\n\\xe9".encode())))
+    ['été\\n', 'Prêt\\n', 'é']
+    >>> list(decode_stream(BytesIO("é\\n".encode() + b"\\xe9\\n"), 3, 3))
+    ['é\\n', 'é\\n']
+    >>>
+    """
+
+    sample = file.read(sample_size)
+    encodings = get_sampled_encodings(sample)
+    decoder = getincrementaldecoder(encodings.pop(0))()
+    pending = ""
+
+    chunks = chain((sample,), iter(partial(file.read, chunk_size), b""))
+    for chunk, final in chain(zip(chunks, repeat(False)), ((b"", True),)):
+        try:
+            text = decoder.decode(chunk, final)
+        except UnicodeDecodeError:
+            chunk = decoder.getstate()[0] + chunk
+            while encodings:
+                decoder = getincrementaldecoder(encodings.pop(0))()
+                with suppress(UnicodeDecodeError):
+                    text = decoder.decode(chunk, final)
+                    break
+            else:
+                raise
+
+        lines = (pending + text).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line + "\n"
+
+    if pending:
+        yield pending
 
 
 b64encode = partial(b2a_base64, newline=False)
@@ -218,6 +360,195 @@ def urlsafe_b64decode(data: bytes) -> bytes:
     return b64decode(data).translate(_urlsafe_decode_translation)
 
 
+_whitespaces = b" \t\r\n\x0b\x0c"
+
+
+def read_blocks(
+    file: BinaryIO, size: int, multiple: int, ignore: bytes = None
+) -> Iterator[memoryview]:
+    """
+    This function reads the file with readinto in a reusable buffer
+    and yields blocks of a multiple of multiple bytes (except the
+    last one), remaining bytes are moved at the start of the buffer.
+    Bytes in ignore are removed. Blocks are only valid until the
+    next iteration.
+
+    >>> from io import BytesIO
+    >>> [bytes(block) for block in read_blocks(BytesIO(b"abcdefg"), 5, 3)]
+    [b'abc', b'def', b'g']
+    >>> [bytes(b) for b in read_blocks(BytesIO(b"ab\\ncd\\nef"), 4, 2, b"\\n")]
+    [b'ab', b'cd', b'ef']
+    >>>
+    """
+
+    size = max(size - size % multiple, multiple)
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    pending = 0
+
+    while True:
+        read = file.readinto(view[pending:])
+        if not read:
+            break
+
+        if ignore:
+            data = view[pending : pending + read].tobytes().translate(
+                None, ignore
+            )
+            read = len(data)
+            buffer[pending : pending + read] = data
+
+        total = pending + read
+        usable = total - total % multiple
+        if usable:
+            yield view[:usable]
+
+        pending = total - usable
+        buffer[:pending] = buffer[usable:total]
+
+    if pending:
+        yield view[:pending]
+
+
+def map_blocks(
+    function: Callable, blocks: Iterable[memoryview], workers: int = None
+) -> Iterator[bytes]:
+    """
+    This function yields function(block) for each block,
+    in a thread pool of workers threads (keeping order)
+    when workers is defined.
+    """
+
+    if not workers:
+        yield from map(function, blocks)
+        return
+
+    window = deque()
+    with ThreadPoolExecutor(workers) as executor:
+        for block in blocks:
+            window.append(executor.submit(function, block.tobytes()))
+            if len(window) >= workers * 2:
+                yield window.popleft().result()
+
+        while window:
+            yield window.popleft().result()
+
+
+def _urlsafe_b64encode_block(data: bytes) -> bytes:
+    return b64encode(data).translate(_urlsafe_encode_translation)
+
+
+def _urlsafe_b64decode_block(data: bytes) -> bytes:
+    return b64decode(bytes(data).translate(_urlsafe_decode_translation))
+
+
+def b64encode_stream(
+    file: BinaryIO,
+    chunk_size: int = 196608,
+    workers: int = None,
+    urlsafe: bool = False,
+) -> Iterator[bytes]:
+    """
+    This function yields base64 encoded chunks of the file
+    (or socket.makefile("rb")) read by blocks of a multiple
+    of 3 bytes, workers threads encode blocks in parallel.
+
+    >>> from io import BytesIO
+    >>> b"".join(b64encode_stream(BytesIO(bytes(range(256))), 6))
+    b'AAECAwQFBgcICQoLDA0ODxAREhMUFRYXGBkaGxwdHh8gISIjJCUmJygpKissLS4vMDEyMzQ1Njc4OTo7PD0+P0BBQkNERUZHSElKS0xNTk9QUVJTVFVWV1hZWltcXV5fYGFiY2RlZmdoaWprbG1ub3BxcnN0dXZ3eHl6e3x9fn+AgYKDhIWGh4iJiouMjY6PkJGSk5SVlpeYmZqbnJ2en6ChoqOkpaanqKmqq6ytrq+wsbKztLW2t7i5uru8vb6/wMHCw8TFxsfIycrLzM3Oz9DR0tPU1dbX2Nna29zd3t/g4eLj5OXm5+jp6uvs7e7v8PHy8/T19vf4+fr7/P3+/w=='
+    >>> b"".join(b64encode_stream(BytesIO(b"\\xfb\\xff"), 3, 2, True))
+    b'-_8='
+    >>>
+    """
+
+    return map_blocks(
+        _urlsafe_b64encode_block if urlsafe else b64encode,
+        read_blocks(file, chunk_size, 3),
+        workers,
+    )
+
+
+def b64decode_stream(
+    file: BinaryIO,
+    chunk_size: int = 262144,
+    workers: int = None,
+    urlsafe: bool = False,
+) -> Iterator[bytes]:
+    """
+    This function yields base64 decoded chunks of the file
+    read by blocks of a multiple of 4 characters (whitespaces
+    and new lines are ignored), workers threads decode blocks
+    in parallel.
+
+    >>> from io import BytesIO
+    >>> b"".join(b64decode_stream(BytesIO(b"YWJj\\nZGVm\\nZw==\\n"), 6))
+    b'abcdefg'
+    >>> b"".join(b64decode_stream(BytesIO(b"-_8="), workers=2, urlsafe=True))
+    b'\\xfb\\xff'
+    >>>
+    """
+
+    return map_blocks(
+        _urlsafe_b64decode_block if urlsafe else b64decode,
+        read_blocks(file, chunk_size, 4, _whitespaces),
+        workers,
+    )
+
+
+def b16encode_stream(
+    file: BinaryIO, chunk_size: int = 65536, workers: int = None
+) -> Iterator[bytes]:
+    """
+    This function yields hexadecimal encoded chunks of the file,
+    workers threads encode blocks in parallel.
+
+    >>> from io import BytesIO
+    >>> b"".join(b16encode_stream(BytesIO(b"abc"), 2))
+    b'616263'
+    >>>
+    """
+
+    return map_blocks(b16encode, read_blocks(file, chunk_size, 1), workers)
+
+
+def b16decode_stream(
+    file: BinaryIO, chunk_size: int = 131072, workers: int = None
+) -> Iterator[bytes]:
+    """
+    This function yields hexadecimal decoded chunks of the file
+    read by blocks of a multiple of 2 characters (whitespaces
+    and new lines are ignored), workers threads decode blocks
+    in parallel.
+
+    >>> from io import BytesIO
+    >>> b"".join(b16decode_stream(BytesIO(b"616\\n263"), 3, 2))
+    b'abc'
+    >>>
+    """
+
+    return map_blocks(
+        b16decode, read_blocks(file, chunk_size, 2, _whitespaces), workers
+    )
+
+
+def write_stream(chunks: Iterable[bytes], file: BinaryIO) -> int:
+    """
+    This function writes chunks in the file (or socket.makefile("wb"))
+    and returns the number of written bytes.
+
+    >>> from io import BytesIO
+    >>> output = BytesIO()
+    >>> write_stream(b16encode_stream(BytesIO(b"abc")), output)
+    6
+    >>> output.getvalue()
+    b'616263'
+    >>>
+    """
+
+    write = file.write
+    return sum(write(chunk) for chunk in chunks)
+
+
 if __name__ == "__main__":
     import doctest
 
@@ -23,6 +23,73 @@
 This package implements tools to build python package and tools.
 This module implements a library to get an Enhanced Structure with
 colored printer, dict convertion and HTML extract.
+
+>>> from EnhancedStructure import *
+>>> from EnhancedStructure import FieldMeta
+>>> from ctypes import c_uint16
+>>> class Header(EnhancedStruct(little_endian=True)):
+...     _fields_ = [("magic", c_uint16), ("flags", c_uint16)]
+...     _field_metas_ = {
+...         "magic": FieldMeta(enum=[EnumMeta(0x5A4D, "MZ", "Valid", normality=1.0), EnumMeta(0x4D5A, "ZM", "Swapped", normality=0.5)]),
+...         "flags": FieldMeta(flags=[FlagMeta(0, "A", "Abnormal", normality=0.0), FlagMeta(1, "B", "Unusual", normality=0.5)]),
+...     }
+...
+>>> [(field.name, field.offset, field.size) for field in Header._get_layout()]
+[('magic', 0, 2), ('flags', 2, 2)]
+>>> Header._get_layout() is Header._get_layout()
+True
+>>> header = Header.from_buffer_copy(bytes.fromhex("5a4d0200"))
+>>> {name: (field["range"], field["normality"]) for name, field in header.to_dict().items()}
+{'magic': ((0, 2), 0.5), 'flags': ((2, 4), 0.5)}
+>>> from tempfile import TemporaryDirectory
+>>> from os.path import join
+>>> data = bytes.fromhex("4d5a0000" "5a4d0200" "00000100")
+>>> records = list(Header.parse_many(data))
+>>> [(record._struct_offset_, hex(record.magic), record.flags) for record in records]
+[(0, '0x5a4d', 0), (4, '0x4d5a', 2), (8, '0x0', 1)]
+>>> [record.to_dict()["flags"]["range"] for record in Header.parse_many(data, offset=4, count=5)]
+[(6, 8), (10, 12)]
+>>> directory = TemporaryDirectory()
+>>> path = join(directory.name, "headers.bin")
+>>> with open(path, "wb") as file:
+...     file.write(bytes(6) + data)
+...
+18
+>>> [(record._struct_offset_, bytes(record) == (bytes(6) + data)[record._struct_offset_:record._struct_offset_ + 4]) for record in Header.iter_from_file(path, offset=6)]
+[(6, True), (10, True), (14, True)]
+>>> [record.to_dict()["magic"]["range"] for record in Header.iter_from_file(path, offset=10, count=1)]
+[(10, 12)]
+>>> directory.cleanup()
+>>> scores = Header.scan_normality(records)
+>>> [(score, record._struct_offset_) for score, record in scores]
+[(0.0, 8), (0.5, 4), (1.0, 0)]
+>>> scores == Header.scan_normality(records, use_numpy=False)
+True
+>>> [(min(field["normality"] for field in record.to_dict().values()), record._struct_offset_) for record in records]
+[(1.0, 0), (0.5, 4), (0.0, 8)]
+>>> [(score, record._struct_offset_) for score, record in Header.scan_normality(records, threshold=0.8)]
+[(0.0, 8), (0.5, 4)]
+>>> from io import StringIO
+>>> report = StringIO()
+>>> write_report(records, report, format="markdown", page_size=2)
+3
+>>> [line for line in report.getvalue().splitlines() if line.startswith("#") or line == "---"]
+['# EnhancedStruct report', '# Page 1', '## Header', '## Header', '---', '# Page 2', '## Header']
+>>> html = StringIO()
+>>> write_report(records, html, page_size=2, buffer_size=1)
+3
+>>> html.getvalue().count('<section class="page"'), html.getvalue().count('<a href="#page-2">Next page</a>')
+(2, 1)
+>>> unpaginated = StringIO()
+>>> write_report(records, unpaginated)
+3
+>>> "<section" in unpaginated.getvalue()
+False
+>>>
+
+Run tests:
+ ~# python -m doctest EnhancedStructure.py
+ ~# python EnhancedStructure.py            # test printer
 """
 
 __version__ = "0.0.1"
@@ -45,15 +112,29 @@ under certain conditions.
 __license__ = license
 __copyright__ = copyright
 
-__all__ = ["FlagMeta", "EnumMeta", "EnhancedStruct"]
+__all__ = ["FlagMeta", "EnumMeta", "EnhancedStruct", "write_report"]
 
 from ctypes import LittleEndianStructure, Structure, c_uint16, Array, _SimpleCData, sizeof
-from typing import Callable, TypeVar, Dict, Any
+from typing import Callable, TypeVar, Dict, Any, Tuple, Iterator, Union, List, Iterable, TextIO
+from mmap import mmap, ACCESS_COPY
+from contextlib import suppress
+from functools import lru_cache
 from binascii import hexlify
+from html import escape
 from string import printable
-from sys import exit
-
-_EnhancedStruct = TypeVar("_EnhancedStruct", (Structure, LittleEndianStructure))
+from operator import attrgetter
+from os import PathLike
+from array import array
+from sys import exit, stdout
+
+try:
+    from numpy import array as numpy_array, minimum, ones, searchsorted, where
+except ImportError:
+    NUMPY = False
+else:
+    NUMPY = True
+
+_EnhancedStruct = TypeVar("_EnhancedStruct", Structure, LittleEndianStructure)
 printable = set(ord(c) for c in printable.strip())
 
 def field_to_bytes(value) -> bytes:
@@ -118,6 +199,89 @@ class FieldMeta:
         self.enum = enum or []
         self.calcul_normality = calcul_normality
 
+class FieldLayout:
+    """
+    This class implements the compiled layout of a field
+    (offset, size, resolved meta, enum by value and flags masks).
+    For duplicated enum values the last EnumMeta is used.
+
+    >>> meta = FieldMeta(enum=[EnumMeta(1, "A", "First"), EnumMeta(1, "B", "Last")])
+    >>> FieldLayout("field", 0, 2, meta).enum[1].name
+    'B'
+    >>>
+    """
+
+    __slots__ = ("name", "offset", "size", "meta", "enum", "flags")
+
+    def __init__(self, name: str, offset: int, size: int, meta: FieldMeta):
+        self.name = name
+        self.offset = offset
+        self.size = size
+        self.meta = meta
+        self.enum = {}
+        for enum in meta.enum:
+            self.enum[enum.value] = enum
+        self.flags = tuple((1 << flag.bit, flag) for flag in meta.flags)
+
+
+def build_layout(struct: type) -> Tuple[FieldLayout, ...]:
+    """
+    This function computes the layout table of a structure class.
+    """
+
+    metas = struct._field_metas_
+    default = FieldMeta()
+    return tuple(
+        FieldLayout(name, getattr(struct, name).offset, sizeof(field_type), metas.get(name, default))
+        for name, field_type, *_ in struct._fields_
+    )
+
+def numpy_field_normality(field: FieldLayout, values: List[Any]) -> Any:
+    """
+    This function returns the vectorised normality scores
+    of a field for all values (NumPy array) or None when
+    values are not integers.
+    """
+
+    values = numpy_array(values)
+    if values.dtype.kind not in "iu":
+        return None
+
+    if field.flags:
+        scores = ones(len(values))
+        for mask, flag in field.flags:
+            scores *= where(values & mask, flag.normality, 1.0)
+        return scores
+
+    keys = sorted(field.enum)
+    normalities = numpy_array([field.enum[key].normality for key in keys])
+    keys = numpy_array(keys)
+    indexes = searchsorted(keys, values).clip(0, len(keys) - 1)
+    return where(keys[indexes] == values, normalities[indexes], 0.0)
+
+
+def array_field_normality(field: FieldLayout, values: List[Any]) -> array:
+    """
+    This function returns normality scores of a field
+    for all values (array module fallback).
+    """
+
+    if field.flags:
+        flags = field.flags
+        scores = array("d")
+        append = scores.append
+        for value in values:
+            score = 1.0
+            for mask, flag in flags:
+                if value & mask:
+                    score *= flag.normality
+            append(score)
+        return scores
+
+    get = field.enum.get
+    return array("d", (0.0 if enum is None else enum.normality for enum in map(get, values)))
+
+
 def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
     """
     This function implements the enhenced structure build.
@@ -135,52 +299,189 @@ def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
         _struct_desc_ = ""
         _struct_offset_ = 0
 
+        @classmethod
+        def _get_layout(cls) -> Tuple[FieldLayout, ...]:
+            """
+            This method returns the layout table of the class,
+            computed once on first use.
+            """
+
+            layout = cls.__dict__.get("_layout_")
+            if layout is None:
+                layout = build_layout(cls)
+                cls._layout_ = layout
+                cls._layout_by_name_ = {field.name: field for field in layout}
+            return layout
+
+        @classmethod
+        def _get_field_layout(cls, name: str) -> FieldLayout:
+            """
+            This method returns the layout of a field.
+            """
+
+            cls._get_layout()
+            field = cls._layout_by_name_.get(name)
+            if field is None:
+                raise ValueError(f"Field {name} not found in _fields_")
+            return field
+
+        @classmethod
+        def parse_many(cls, buffer: Union[bytes, bytearray, memoryview, mmap], offset: int = 0, count: int = None) -> Iterator["_EnhancedStruct"]:
+            """
+            This method yields structures parsed from the buffer
+            (lazy views without copy when the buffer is writable,
+            one record copy otherwise) and sets _struct_offset_.
+            """
+
+            view = memoryview(buffer)
+            size = sizeof(cls)
+            available = max((view.nbytes - offset) // size, 0)
+            count = available if count is None else min(count, available)
+            parse = cls.from_buffer_copy if view.readonly else cls.from_buffer
+
+            for offset in range(offset, offset + count * size, size):
+                record = parse(view, offset)
+                record._struct_offset_ = offset
+                yield record
+
+        @classmethod
+        def iter_from_file(cls, path: Union[str, PathLike], offset: int = 0, count: int = None) -> Iterator["_EnhancedStruct"]:
+            """
+            This method yields structures parsed from a file mapped
+            in memory (copy-on-write, records are views on the pages).
+            """
+
+            with open(path, "rb") as file:
+                try:
+                    mapping = mmap(file.fileno(), 0, access=ACCESS_COPY)
+                except ValueError:
+                    return
+
+            try:
+                yield from cls.parse_many(mapping, offset, count)
+            finally:
+                with suppress(BufferError):
+                    mapping.close()
+
+        @classmethod
+        def scan_normality(cls, records: Iterable["_EnhancedStruct"], threshold: float = None, use_numpy: bool = True) -> List[Tuple[float, "_EnhancedStruct"]]:
+            """
+            This method computes the normality of many records (the
+            lowest field normality) field by field, vectorised with
+            NumPy (or the array module), and returns (score, record)
+            sorted by score, only scores below threshold if defined.
+            """
+
+            records = list(records)
+            scores = [1.0] * len(records)
+            use_numpy = use_numpy and NUMPY
+            if use_numpy:
+                scores = numpy_array(scores)
+
+            for field in cls._get_layout():
+                calcul_normality = field.meta.calcul_normality
+                if not field.flags and not field.enum and not calcul_normality:
+                    continue
+
+                values = list(map(attrgetter(field.name), records))
+                field_scores = None
+
+                if field.flags or field.enum:
+                    if use_numpy:
+                        field_scores = numpy_field_normality(field, values)
+                    elif all(isinstance(value, int) for value in values):
+                        field_scores = array_field_normality(field, values)
+
+                if field_scores is None:
+                    field_normality = records[0]._field_normality if records else None
+                    field_scores = [field_normality(field, value) for value in values]
+
+                if use_numpy:
+                    scores = minimum(scores, field_scores)
+                else:
+                    scores = list(map(min, scores, field_scores))
+
+            result = [
+                (score, record)
+                for score, record in zip(map(float, scores), records)
+                if threshold is None or score < threshold
+            ]
+            result.sort(key=lambda x: x[0])
+            return result
+
+        def _iter_rows(self, verbosity: int = 1) -> Iterator[Tuple[str, int, int, str, str, str, float, str]]:
+            """
+            This method yields a row (name, start, end, hex value, ASCII,
+            field description, normality, value description) per field
+            and per flag set in the field value.
+            """
+
+            struct_offset = self._struct_offset_
+            for field_layout in self._get_layout():
+                meta = field_layout.meta
+                if meta.verbosity > verbosity:
+                    continue
+
+                field = field_layout.name
+                value = getattr(self, field)
+                data = field_to_bytes(value)
+                hex_part = hexlify(data).decode()
+                ascii_part = "".join(chr(x) if x in printable else "." for x in data)
+                score = self._field_normality(field_layout, value)
+                start = struct_offset + field_layout.offset
+                row = (meta.short_name or field, start, start + field_layout.size, hex_part, ascii_part, meta.short_desc, score)
+
+                use_flag = False
+                for mask, flag in field_layout.flags:
+                    if mask & value:
+                        use_flag = True
+                        yield row + (f"{flag.name}: {flag.short_desc}",)
+
+                if not use_flag:
+                    enum_value = field_layout.enum.get(value) if field_layout.enum else None
+                    yield row + ((enum_value and f"{enum_value.name}: {enum_value.short_desc}") or "",)
+
         def _get_field_meta(self, name: str) -> FieldMeta:
             """
             This method returns a resolved name field with fallback.
             """
 
-            return self._field_metas_.get(name, FieldMeta())
+            return self._get_field_layout(name).meta
 
         def _get_field_range(self, name: str) -> Tuple[int, int]:
             """
             This method returns the start/end offset of the field.
             """
 
-            offset = getattr(type(self), name).offset
+            field = self._get_field_layout(name)
+            start = self._struct_offset_ + field.offset
+            return start, start + field.size
 
-            field_type = None
-            for fname, ftype in self._fields_:
-                if fname == name:
-                    field_type = ftype
-                    break
-            else:
-                raise ValueError(f"Field {name} not found in _fields_")
-
-            size = sizeof(field_type)
-            return self._struct_offset_ + offset, self._struct_offset_ + offset + size
-
-        def _normality_score(self, name: str, value: Any):
+        def _field_normality(self, field: FieldLayout, value: Any) -> float:
             """
-            This method returns the normality based on the field type.
+            This method returns the normality based on the field layout.
             """
 
-            meta = self._get_field_meta(name)
-
-            if meta.flags:
+            if field.flags:
                 score = 1.0
-                for f in meta.flags:
-                    if value & (1 << f.bit):
-                        score *= f.normality
+                for mask, flag in field.flags:
+                    if value & mask:
+                        score *= flag.normality
                 return score
 
-            if meta.enum:
-                for e in meta.enum:
-                    if e.value == value:
-                        return e.normality
-                return 0.0
+            if field.enum:
+                enum = field.enum.get(value)
+                return 0.0 if enum is None else enum.normality
 
-            return (meta.calcul_normality and meta.calcul_normality(value)) or 1.0
+            calcul_normality = field.meta.calcul_normality
+            return (calcul_normality and calcul_normality(value)) or 1.0
+
+        def _normality_score(self, name: str, value: Any):
+            """
+            This method returns the normality based on the field type.
+            """
+
+            return self._field_normality(self._get_field_layout(name), value)
 
         def to_dict(self, verbosity: int = 1) -> Dict[str, Dict[str, Any]]:
             """
@@ -189,19 +490,20 @@ def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
             """
 
             result = {}
-            for field, _ in self._fields_:
-                meta = self._get_field_meta(field)
+            struct_offset = self._struct_offset_
+            for field in self._get_layout():
+                meta = field.meta
                 if meta.verbosity > verbosity:
                     continue
 
-                value = getattr(self, field)
-                start, end = self._get_field_range(field)
+                value = getattr(self, field.name)
+                start = struct_offset + field.offset
 
-                result[field] = {
-                    "friendly_name": meta.short_name or field,
+                result[field.name] = {
+                    "friendly_name": meta.short_name or field.name,
                     "value": value,
-                    "range": (start, end),
-                    "normality": self._normality_score(field, value),
+                    "range": (start, start + field.size),
+                    "normality": self._field_normality(field, value),
                     "description": meta.short_desc,
                 }
 
@@ -229,17 +531,19 @@ def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
                 </tr>
             """
 
-            for field, _ in self._fields_:
-                meta = self._get_field_meta(field)
+            struct_offset = self._struct_offset_
+            for field_layout in self._get_layout():
+                meta = field_layout.meta
                 if meta.verbosity > verbosity:
                     continue
 
+                field = field_layout.name
                 value = getattr(self, field)
                 data = field_to_bytes(value)
                 hex_part = hexlify(data).decode()
                 ascii_part = "".join(chr(x) if x in printable else "." for x in data)
 
-                score = self._normality_score(field, value)
+                score = self._field_normality(field_layout, value)
 
                 if score < 0.5:
                     value_color = "#ff4d4d"  # red
@@ -248,17 +552,15 @@ def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
                 else:
                     value_color = "#4caf50"  # green
 
-                start, end = self._get_field_range(field)
+                start = struct_offset + field_layout.offset
+                end = start + field_layout.size
                 range_str = f"{start:08x}-{end:08x}"
 
-                enum_value = None
-                for enum in meta.enum:
-                    if enum.value == value:
-                        enum_value = enum
+                enum_value = field_layout.enum.get(value) if field_layout.enum else None
 
                 use_flag = False
-                for flag in meta.flags:
-                    if (1 << flag.bit) & value:
+                for mask, flag in field_layout.flags:
+                    if mask & value:
                         use_flag = True
                         html += f"""
                         <tr>
@@ -311,18 +613,21 @@ def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
 
             self._print_struct_header(color=color)
 
-            for field, _ in self._fields_:
-                meta = self._field_metas_.get(field, FieldMeta())
+            struct_offset = self._struct_offset_
+            for field_layout in self._get_layout():
+                meta = field_layout.meta
                 if meta.verbosity > verbosity:
                     continue
 
+                field = field_layout.name
                 value = getattr(self, field)
-                start, end = self._get_field_range(field)
+                start = struct_offset + field_layout.offset
+                end = start + field_layout.size
                 data = field_to_bytes(value)
                 hex_part = hexlify(data).decode().ljust(40)
                 ascii_part = "".join(chr(x) if x in printable else "." for x in data).ljust(20)
 
-                score = self._normality_score(field, value)
+                score = self._field_normality(field_layout, value)
 
                 if color:
                     if score < 0.5:
@@ -351,6 +656,164 @@ def EnhancedStruct(little_endian=False) -> _EnhancedStruct:
 
     return _EnhancedStruct
 
+report_css = """
+body{font-family:monospace;font-weight:bold;}
+h2{background-color:#323232;color:#aff10b;padding:4px;text-align:center;}
+table{border-collapse:collapse;width:100%;}
+th,td{border:1px solid #000;padding:2px;}
+.field{background:#b779e3;color:#fff;}
+.range{background:#fff0af;color:#000;}
+.hex{background:#ffd00b;}
+.ascii{background:#d4abf2;}
+.desc{background:#c9f757;color:#000;}
+.value{background:#e0e0e0;}
+th.hex,th.ascii{color:#000;}
+th.value{color:#333;}
+.abnormal{color:#ff4d4d;}
+.warning{color:#b36b00;}
+.normal{color:#4caf50;}
+.page{page-break-after:always;}
+"""
+
+
+cached_escape = lru_cache(maxsize=65536)(escape)
+
+
+def get_normality_class(score: float) -> str:
+    """
+    This function returns the CSS class for a normality score.
+    """
+
+    if score < 0.5:
+        return "abnormal"
+    elif score < 0.8:
+        return "warning"
+    return "normal"
+
+
+def html_struct(struct: _EnhancedStruct, verbosity: int = 1) -> str:
+    """
+    This function returns the HTML table of a structure using CSS classes.
+    """
+
+    parts = [
+        f"<h2>{cached_escape(struct._struct_name_ or type(struct).__name__)}</h2>\n<table>\n"
+        '<tr><th class="field">Field</th><th class="range">Range</th><th class="hex">Hex Value</th>'
+        '<th class="ascii">ASCII</th><th class="desc">Field description</th><th class="value">Value description</th></tr>\n'
+    ]
+    append = parts.append
+
+    for name, start, end, hex_part, ascii_part, description, score, value_description in struct._iter_rows(verbosity):
+        normality = get_normality_class(score)
+        append(
+            f'<tr><td class="field">{cached_escape(name)}</td><td class="range">{start:08x}-{end:08x}</td>'
+            f'<td class="hex {normality}">{hex_part}</td><td class="ascii {normality}">{cached_escape(ascii_part)}</td>'
+            f'<td class="desc">{cached_escape(description)}</td><td class="value {normality}">{cached_escape(value_description)}</td></tr>\n'
+        )
+
+    append("</table>\n")
+    return "".join(parts)
+
+
+def markdown_escape(text: str) -> str:
+    """
+    This function escapes a Markdown table cell.
+    """
+
+    return text.replace("\\", "\\\\").replace("|", "\\|")
+
+
+def markdown_struct(struct: _EnhancedStruct, verbosity: int = 1) -> str:
+    """
+    This function returns the Markdown table of a structure.
+    """
+
+    parts = [
+        f"## {struct._struct_name_ or type(struct).__name__}\n\n"
+        "| Field | Range | Hex Value | ASCII | Field description | Value description | Normality |\n"
+        "|---|---|---|---|---|---|---|\n"
+    ]
+    append = parts.append
+
+    for name, start, end, hex_part, ascii_part, description, score, value_description in struct._iter_rows(verbosity):
+        append(
+            f"| {markdown_escape(name)} | {start:08x}-{end:08x} | {hex_part} | {markdown_escape(ascii_part)} "
+            f"| {markdown_escape(description)} | {markdown_escape(value_description)} | {score:.2f} |\n"
+        )
+
+    append("\n")
+    return "".join(parts)
+
+
+def write_report(structs: Iterable[_EnhancedStruct], file: TextIO, verbosity: int = 1, format: str = "html", page_size: int = None, title: str = "EnhancedStruct report", buffer_size: int = 65536) -> int:
+    """
+    This function writes a report of many structures in one document
+    (format is "html" or "markdown") through a buffer flushed every
+    buffer_size characters, with page_size structures per page
+    (no pagination by default). Returns the number of structures.
+    """
+
+    markdown = format.lower() in ("markdown", "md")
+    if not markdown and format.lower() != "html":
+        raise ValueError(f"Invalid report format: {format!r}")
+
+    render = markdown_struct if markdown else html_struct
+    write = file.write
+    buffer = []
+    size = 0
+
+    def emit(text: str) -> None:
+        nonlocal size
+        buffer.append(text)
+        size += len(text)
+        if size >= buffer_size:
+            write("".join(buffer))
+            buffer.clear()
+            size = 0
+
+    def start_page(page: int) -> None:
+        if markdown:
+            emit(f"# Page {page}\n\n")
+        else:
+            emit(f'<section class="page" id="page-{page}">\n')
+
+    def end_page(page: int, last: bool) -> None:
+        if markdown:
+            emit("" if last else "---\n\n")
+        else:
+            emit("" if last else f'<nav><a href="#page-{page + 1}">Next page</a></nav>\n')
+            emit("</section>\n")
+
+    if markdown:
+        emit(f"# {title}\n\n")
+    else:
+        emit(
+            f'<!DOCTYPE html>\n<html>\n<head>\n<meta charset="utf-8">\n<title>{escape(title)}</title>\n'
+            f"<style>{report_css}</style>\n</head>\n<body>\n"
+        )
+
+    counter = 0
+    page = 0
+    for struct in structs:
+        if page_size and counter % page_size == 0:
+            if page:
+                end_page(page, False)
+            page += 1
+            start_page(page)
+
+        emit(render(struct, verbosity))
+        counter += 1
+
+    if page:
+        end_page(page, True)
+
+    if not markdown:
+        emit("</body>\n</html>\n")
+
+    write("".join(buffer))
+    return counter
+
+
 def test() -> int:
     """
     This function test the file.
@@ -397,7 +860,10 @@ def test() -> int:
             ),
         }
 
+    headers = []
+
     hdr = MZHeader()
+    headers.append(hdr)
     hdr.e_magic = c_uint16(0x5A4D)
     hdr.e_cblp = c_uint16(144)
     hdr.e_test = c_uint16(0x5A4D)
@@ -408,6 +874,7 @@ def test() -> int:
     print(hdr.to_html())
 
     hdr = MZHeader()
+    headers.append(hdr)
     hdr.e_magic = 0x5A4D
     hdr.e_cblp = 144
     hdr.e_test = 0x0000
@@ -418,6 +885,7 @@ def test() -> int:
     print(hdr.to_html())
 
     hdr = MZHeader()
+    headers.append(hdr)
     hdr.e_magic = 0x5A4D
     hdr.e_cblp = 144
     hdr.e_test = 0x0001
@@ -426,6 +894,16 @@ def test() -> int:
     hdr.pretty_print()
     print(hdr.to_dict())
     print(hdr.to_html())
+
+    records = list(MZHeader.parse_many(b"".join(map(bytes, headers))))
+    print("Offsets:", [record._struct_offset_ for record in records])
+    scores = MZHeader.scan_normality(records)
+    print("NumPy and array scores are equal:", scores == MZHeader.scan_normality(records, use_numpy=False))
+    for score, record in scores:
+        normality = min(field["normality"] for field in record.to_dict().values())
+        print(f"Offset: {record._struct_offset_}, score: {score}, to_dict normality: {normality}")
+
+    write_report(records, stdout, format="markdown", page_size=2)
     return 0
 
 if __name__ == "__main__":
@@ -87,12 +87,16 @@ under certain conditions.
 __license__ = license
 __copyright__ = copyright
 
-__all__ = ["printf", "STATES"]
+__all__ = ["printf", "STATES", "Progress", "MultiProgress"]
 
 from sys import argv
-from typing import Union
+from math import inf
+from queue import Queue, Empty
 from platform import system
+from time import perf_counter
 from dataclasses import dataclass
+from threading import RLock, Thread
+from typing import Union, Sequence, Tuple
 
 
 @dataclass
@@ -116,6 +120,27 @@ STATES = {
 states_get = STATES.get
 
 
+def get_progressbar(
+    pourcent: int, progressbar: ProgressBar = ProgressBar
+) -> str:
+    """
+    This function returns the progress bar for pourcent.
+    """
+
+    max_size = progressbar.size
+    char_size = 100 / max_size
+    pourcent_size = round(pourcent / char_size)
+    if pourcent_size > max_size:
+        pourcent_size = max_size
+
+    return (
+        progressbar.start
+        + (progressbar.character * pourcent_size)
+        + (progressbar.empty * (max_size - pourcent_size))
+        + progressbar.end
+    )
+
+
 def printf(
     string: str,
     state: str = "OK",
@@ -137,17 +162,7 @@ def printf(
     has_pourcent = pourcent is not None
 
     if has_pourcent and add_progressbar:
-        max_size = progressbar.size
-        char_size = 100 / max_size
-        pourcent_size = round(pourcent / char_size)
-        if pourcent_size > max_size:
-            pourcent_size = max_size
-        progress_bar = (
-            progressbar.start
-            + (progressbar.character * pourcent_size)
-            + (progressbar.empty * (max_size - pourcent_size))
-            + progressbar.end
-        )
+        progress_bar = get_progressbar(pourcent, progressbar)
 
     if has_pourcent:
         progress_bar = f"{pourcent}% {progress_bar}\x1b[39m{end}\x1b[F"
@@ -163,3 +178,311 @@ def printf(
         )
 
     print(to_print, flush=True, end="", **kwargs)
+
+
+class Progress:
+
+    """
+    This class prints a progression with printf only when the
+    displayed pourcent changes or after interval seconds, with
+    the throughput and the ETA.
+
+    counter can be a shared multiprocessing.Value (integer) to
+    update the progression from multiple processes, updates
+    are thread-safe.
+
+    Without total (0 or less) the pourcent never changes, the
+    progression is printed only after interval seconds.
+
+    >>> progress = Progress(1000, "Downloading")
+    >>> progress.get_text(250, 10)
+    'Downloading 250/1000 (25.00/s, ETA 00:00:30)'
+    >>> from io import StringIO
+    >>> file = StringIO()
+    >>> progress = Progress(0, interval=60, file=file)
+    >>> progress.update(5)
+    >>> progress.update(5)
+    >>> progress.count, progress.next_count, file.getvalue().count("/0 (")
+    (10, inf, 1)
+    >>>
+    """
+
+    def __init__(
+        self,
+        total: int,
+        string: str = "",
+        state: str = "OK",
+        interval: float = 0.5,
+        counter: "multiprocessing.Value" = None,
+        **kwargs,
+    ):
+        self.total = total
+        self.string = string
+        self.state = state
+        self.interval = interval
+        self.counter = counter
+        self.kwargs = kwargs
+        self.count = 0
+
+        self.lock = RLock() if counter is None else counter.get_lock()
+        self.start = perf_counter()
+        self.next_time = 0
+        self.next_count = 0
+
+    def get_text(self, count: int, elapsed: float) -> str:
+        """
+        This function returns the text with the counter,
+        the throughput and the ETA.
+        """
+
+        rate = count / elapsed if elapsed else 0
+        remaining = int((self.total - count) / rate) if rate else 0
+        minutes, seconds = divmod(remaining, 60)
+        hours, minutes = divmod(minutes, 60)
+
+        return (
+            f"{self.string} {count}/{self.total} ({rate:.2f}/s, "
+            f"ETA {hours:02}:{minutes:02}:{seconds:02})"
+        ).lstrip()
+
+    def draw(self, count: int, now: float) -> None:
+        """
+        This function prints the progression.
+        """
+
+        total = self.total
+        pourcent = count * 100 // total if total else 100
+
+        printf(
+            self.get_text(count, now - self.start),
+            self.state,
+            pourcent,
+            oneline_progress=True,
+            **self.kwargs,
+        )
+
+        self.next_time = now + self.interval
+        if total > 0:
+            self.next_count = -(-(pourcent + 1) * total // 100)
+        else:
+            self.next_count = inf
+
+    def update(self, number: int = 1) -> None:
+        """
+        This function adds number to the counter and prints
+        the progression if it should be redrawn.
+        """
+
+        counter = self.counter
+
+        with self.lock:
+            if counter is None:
+                self.count = count = self.count + number
+            else:
+                counter.value = count = counter.value + number
+
+            if count >= self.next_count:
+                self.draw(count, perf_counter())
+            elif (now := perf_counter()) >= self.next_time:
+                self.draw(count, now)
+
+    def close(self) -> None:
+        """
+        This function prints the last progression
+        and goes to the next line.
+        """
+
+        counter = self.counter
+
+        with self.lock:
+            self.draw(
+                self.count if counter is None else counter.value,
+                perf_counter(),
+            )
+            print()
+
+    def __enter__(self) -> "Progress":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class MultiProgress:
+
+    """
+    This class prints one progress line per job. Updates are sent
+    in a queue from threads (update method) or processes (send
+    method with a multiprocessing.Queue), a thread repaints the
+    changed lines with one write every refresh seconds.
+
+    >>> multi = MultiProgress([10, 20], ["job 1", "job 2"])
+    >>> multi.format_line(multi.lines[1])
+    '\\x1b[32m[+] job 2 0/20 0% |                    |\\x1b[39m'
+    >>>
+    """
+
+    def __init__(
+        self,
+        totals: Sequence[int],
+        strings: Sequence[str] = None,
+        refresh: float = 0.1,
+        progressbar: ProgressBar = ProgressBar,
+        queue: "Queue" = None,
+    ):
+        strings = strings or [""] * len(totals)
+        self.lines = [
+            [string, "OK", 0, total] for string, total in zip(strings, totals)
+        ]
+        self.queue = Queue() if queue is None else queue
+        self.progressbar = progressbar
+        self.refresh = refresh
+        self.changed = set()
+        self.thread = None
+
+    @staticmethod
+    def send(
+        queue: "Queue",
+        index: int,
+        number: int = 1,
+        state: str = None,
+        string: str = None,
+    ) -> None:
+        """
+        This function sends an update for the index line
+        (use it in worker processes).
+        """
+
+        queue.put((index, number, state, string))
+
+    def update(
+        self,
+        index: int,
+        number: int = 1,
+        state: str = None,
+        string: str = None,
+    ) -> None:
+        """
+        This function sends an update for the index line.
+        """
+
+        self.queue.put((index, number, state, string))
+
+    def format_line(self, line: Tuple[str, str, int, int]) -> str:
+        """
+        This function returns the formatted line.
+        """
+
+        string, state, count, total = line
+        show, color = states_get(state) or ("[ ]", "\x1b[39m")
+        pourcent = count * 100 // total if total else 100
+
+        return (
+            f"{color}{show} {string} {count}/{total} {pourcent}% "
+            f"{get_progressbar(pourcent, self.progressbar)}\x1b[39m"
+        )
+
+    def repaint(self) -> None:
+        """
+        This function prints changed lines with one write.
+        """
+
+        changed = self.changed
+        if not changed:
+            return None
+
+        lines = self.lines
+        size = len(lines)
+        output = []
+
+        for index in sorted(changed):
+            distance = size - index
+            output.append(
+                f"\x1b[{distance}F\x1b[K{self.format_line(lines[index])}"
+                f"\x1b[{distance}E"
+            )
+
+        changed.clear()
+        print("".join(output), end="", flush=True)
+
+    def apply(self, message: Tuple[int, int, str, str]) -> None:
+        """
+        This function applies an update message.
+        """
+
+        index, number, state, string = message
+        line = self.lines[index]
+        line[2] += number
+
+        if state is not None:
+            line[1] = state
+
+        if string is not None:
+            line[0] = string
+
+        self.changed.add(index)
+
+    def run(self) -> None:
+        """
+        This function reads updates and repaints
+        on each refresh tick.
+        """
+
+        get = self.queue.get
+        apply = self.apply
+        refresh = self.refresh
+        next_tick = perf_counter() + refresh
+
+        while True:
+            timeout = next_tick - perf_counter()
+
+            try:
+                message = get(True, timeout if timeout > 0 else 0)
+            except Empty:
+                pass
+            else:
+                if message is None:
+                    break
+                apply(message)
+
+            if perf_counter() >= next_tick:
+                self.repaint()
+                next_tick = perf_counter() + refresh
+
+        self.repaint()
+
+    def start(self) -> None:
+        """
+        This function prints all lines and starts
+        the repaint thread.
+        """
+
+        print("\n" * len(self.lines), end="", flush=True)
+        self.changed.update(range(len(self.lines)))
+        self.repaint()
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        This function applies the last updates
+        and stops the repaint thread (nothing to
+        do if the thread is not started).
+
+        >>> MultiProgress([10]).stop()
+        >>>
+        """
+
+        if self.thread is None:
+            return None
+
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+
+    def __enter__(self) -> "MultiProgress":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
@@ -53,6 +53,8 @@ This package implements tools to build python package and tools.
 <table><thead><tr><th>name</th><th>level</th><th>id</th></tr></thead><tbody><tr><td>test2</td><td>2</td><td>2</td></tr><tr><td>test1</td><td>10</td><td>1</td></tr></tbody><tfoot></tfoot></table>
 >>> r.statistic()
 [{'Name': 'level', 'Sum': 12, 'Max': 10, 'Min': 2, 'Count': 2, 'MaxCount': 1, 'MinCount': 1, 'Average': 6.0, 'Variance': 32, 'Median': 6.0, 'Deviation': 4.0, 'CountGreaterThanAverage': 1, 'CountLessThanAverage': 1, 'CountGreaterThanVariance': 0, 'CountLessThanVariance': 2, 'CountGreaterThanMedian': 1, 'CountLessThanMedian': 1, 'CountGreaterThanDeviation': 1, 'CountLessThanDeviation': 1}, {'Name': 'id', 'Sum': 3, 'Max': 2, 'Min': 1, 'Count': 2, 'MaxCount': 1, 'MinCount': 1, 'Average': 1.5, 'Variance': 0.5, 'Median': 1.5, 'Deviation': 0.5, 'CountGreaterThanAverage': 1, 'CountLessThanAverage': 1, 'CountGreaterThanVariance': 2, 'CountLessThanVariance': 0, 'CountGreaterThanMedian': 1, 'CountLessThanMedian': 1, 'CountGreaterThanDeviation': 2, 'CountLessThanDeviation': 0}]
+>>> r.statistic(workers=2) == r.statistic()
+True
 >>> r2 = Report(r.statistic())
 >>> print(r2.report_text(length=26))
 |Name                      |Sum                       |Max                       |Min                       |Count                     |MaxCount                  |MinCount                  |Average                   |Variance                  |Median                    |Deviation                 |CountGreaterThanAverage   |CountLessThanAverage      |CountGreaterThanVariance  |CountLessThanVariance     |CountGreaterThanMedian    |CountLessThanMedian       |CountGreaterThanDeviation |CountLessThanDeviation    |
@@ -77,6 +79,74 @@ This package implements tools to build python package and tools.
 >>> r.report_JSON()
 >>> r.report_CSV()
 >>> r.statistic()
+>>> from collections import namedtuple
+>>> class Slots:
+...     __slots__ = ("one", "two")
+...     def __init__(self, one, two):
+...         self.one = one
+...         self.two = two
+...
+>>> list(Report.get_dicts([Slots(1, 2), namedtuple("Test", "one two")(3, 4)]))
+[{'one': 1, 'two': 2}, {'one': 3, 'two': 4}]
+>>> rows = list(Report.get_rows([Slots(1, 2), Slots(2, 2)]))
+>>> rows
+[(('one', 'two'), (1, 2)), (('one', 'two'), (2, 2))]
+>>> rows[0][0] is rows[1][0]
+True
+>>> unset = Slots(3, 4)
+>>> del unset.two
+>>> list(Report.get_dicts([unset, Slots(1, 2), unset]))
+[{'one': 3, 'two': None}, {'one': 1, 'two': 2}, {'one': 3, 'two': None}]
+>>> @dataclass
+... class Extra:
+...     one: int = 1
+...     def __post_init__(self):
+...         self.three = 3
+...
+>>> list(Report.get_dicts([Extra()]))
+[{'one': 1, 'three': 3}]
+>>> print(Report([Slots(1, 2), unset]).report_text())
+|one          |two          |
+|-------------|-------------|
+|1            |2            |
+|3            |None         |
+>>> unset.two = len
+>>> list(Report.get_rows([unset]))
+[(('one',), (3,))]
+>>> from io import StringIO
+>>> data = [{"name": f"test{i}", "level": i % 3, "id": i} for i in range(6)]
+>>> r = StreamReport(data, "level", lambda x: x["id"] != 4, run_size=2)
+>>> file = StringIO()
+>>> r.report_CSV(file)
+5
+>>> file.getvalue()
+'name,level,id\r\ntest0,0,0\r\ntest3,0,3\r\ntest1,1,1\r\ntest2,2,2\r\ntest5,2,5\r\n'
+>>> file = StringIO()
+>>> r.report_text(file, filtered=True)
+1
+>>> print(file.getvalue())
+|name         |level        |id           |
+|-------------|-------------|-------------|
+|test4        |1            |4            |
+>>> from tempfile import TemporaryDirectory
+>>> from os.path import join
+>>> directory = TemporaryDirectory()
+>>> r.report_file(join(directory.name, "report.csv.gz"), compression="gzip")
+5
+>>> gzip.open(join(directory.name, "report.csv.gz"), "rt", newline="").readline()
+'name,level,id\r\n'
+>>> r.report_columnar(join(directory.name, "report.ptkc"), format="builtin")
+5
+>>> list(read_columnar(open(join(directory.name, "report.ptkc"), "rb")))[:2]
+[{'name': 'test0', 'level': 0, 'id': 0}, {'name': 'test3', 'level': 0, 'id': 3}]
+>>> directory.cleanup()
+>>> from io import BytesIO
+>>> file = BytesIO()
+>>> write_builtin_columnar([{"a": 1, "b": 2}, {"b": 3}, {"a": 4, "b": 5}], file, batch_size=2)
+3
+>>> _ = file.seek(0)
+>>> list(read_columnar(file))
+[{'a': 1, 'b': 2}, {'b': 3}, {'a': 4, 'b': 5}]
 >>> r = ReportDict({"Debian": 5026, "Windows": 2548, "Red Hat": 3609, "FreeBSD": 92})
 >>> print(r.report_text())
 |keys   |values |
@@ -85,6 +155,14 @@ This package implements tools to build python package and tools.
 |Windows|2548   |
 |Red Hat|3609   |
 |FreeBSD|92     |
+>>> r.report_stream(sample_size=1)
+|keys  |values|
+|------|------|
+|Debian|5026  |
+|Win...|2548  |
+|Red...|3609  |
+|Fre...|92    |
+4
 >>> r.report_CSV()
 'keys,values\r\nDebian,5026\r\nWindows,2548\r\nRed Hat,3609\r\nFreeBSD,92\r\n'
 >>> r.report_HTML()
@@ -104,6 +182,11 @@ This package implements tools to build python package and tools.
 |Windows     |2548        |
 |Red Hat     |3609        |
 |FreeBSD     |92          |
+>>> print(ReportDict({"a": 1, "\u65e5\u672c\u8a9e": 2}).report_text())
+|keys  |values |
+|------|-------|
+|a     |1      |
+|\u65e5\u672c\u8a9e|2      |
 >>>
 
 Run tests:
@@ -146,20 +229,67 @@ under certain conditions.
 __license__ = license
 __copyright__ = copyright
 
-__all__ = ["Report", "ReportDict"]
-
-from typing import Any, Sequence, Union, List, Dict, Tuple
-from statistics import fmean, median, pstdev, variance
-from collections.abc import Callable, Iterator
+__all__ = ["Report", "ReportDict", "StreamReport"]
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Sequence, Union, List, Dict, Tuple, TextIO, BinaryIO
+from itertools import accumulate, chain, filterfalse, islice
+from collections.abc import Callable, Iterator, Iterable
+from pickle import dump, load, HIGHEST_PROTOCOL
+from bisect import bisect_left, bisect_right
+from dataclasses import fields, is_dataclass
+from operator import attrgetter, itemgetter
+from statistics import StatisticsError
+from sys import executable, byteorder
+from tempfile import TemporaryFile
 from csv import DictWriter, writer
+from json import dumps, loads
+from struct import pack, unpack
 from functools import partial
+from heapq import merge
 from io import StringIO
-from json import dumps
+from array import array
+from math import fsum, sqrt
+import gzip
+
+try:
+    from numpy import array as np_array, sort as np_sort
+except ImportError:
+    NUMPY = False
+else:
+    NUMPY = True
+
+try:
+    from pyarrow import RecordBatch, Table, ipc
+    from pyarrow.parquet import ParquetWriter
+except ImportError:
+    PYARROW = False
+else:
+    PYARROW = True
+
+try:
+    import zstandard
+except ImportError:
+    ZSTANDARD = False
+else:
+    ZSTANDARD = True
+
+COLUMNAR_MAGIC = b"PTKC\x01"
 
 if __package__:
-    from .StringF import strings_tableformat
+    from .StringF import (
+        strings_tableformat,
+        stream_tableformat,
+        TableFormatter,
+        string_width,
+    )
 else:
-    from StringF import strings_tableformat
+    from StringF import (
+        strings_tableformat,
+        stream_tableformat,
+        TableFormatter,
+        string_width,
+    )
 
 
 def default_key_function(dict_: dict, attribute: str = None) -> Any:
@@ -188,6 +318,814 @@ def customfilter(
     return new_data, filtered
 
 
+def get_schema(class_: type) -> Tuple[Tuple[str, ...], Callable]:
+    """
+    This function returns field names and a compiled getter
+    for objects of a namedtuple or a class without __dict__
+    (__slots__ class or dataclass with slots), returns None
+    for other classes (attributes are read from __dict__ to
+    keep attributes that are not fields).
+
+    Names are read from the class only, unset slots are
+    reported as None.
+    """
+
+    if issubclass(class_, tuple) and hasattr(class_, "_fields"):
+        names = tuple(class_._fields)
+    elif getattr(class_, "__dictoffset__", 0):
+        return None
+    elif is_dataclass(class_):
+        names = tuple(field.name for field in fields(class_))
+    else:
+        names = []
+        for base in reversed(class_.__mro__):
+            slots = base.__dict__.get("__slots__", ())
+            for name in (slots,) if isinstance(slots, str) else slots:
+                if name not in names and name not in (
+                    "__dict__",
+                    "__weakref__",
+                ):
+                    names.append(name)
+        names = tuple(names)
+
+    if not names:
+        return names, lambda x: ()
+
+    if len(names) == 1:
+        name = names[0]
+        return names, lambda x: (getattr(x, name, None),)
+
+    getter = attrgetter(*names)
+
+    def get_values(object_: object) -> tuple:
+        try:
+            return getter(object_)
+        except AttributeError:
+            return tuple(getattr(object_, name, None) for name in names)
+
+    return names, get_values
+
+
+def get_cached_schema(
+    schemas: Dict[type, Tuple[Tuple[str, ...], Callable]], object_: object
+) -> Tuple[Tuple[str, ...], Callable]:
+    """
+    This function returns the schema for the object class,
+    the schema is computed once per class.
+    """
+
+    class_ = object_.__class__
+
+    if class_ in schemas:
+        return schemas[class_]
+
+    schema = schemas[class_] = get_schema(class_)
+    return schema
+
+
+def get_schema_row(
+    schema: Tuple[Tuple[str, ...], Callable], object_: object
+) -> Tuple[Tuple[str, ...], tuple]:
+    """
+    This function returns (header, values) of an object read
+    with its schema, callable values are ignored like values
+    of __dict__.
+    """
+
+    header, getter = schema
+    values = getter(object_)
+
+    if not any(map(callable, values)):
+        return header, values
+
+    items = [(k, v) for k, v in zip(header, values) if not callable(v)]
+    return tuple(k for k, _ in items), tuple(v for _, v in items)
+
+
+def get_rows(
+    objects: Iterable[Union[dict, object]]
+) -> Iterator[Tuple[Tuple[str, ...], tuple]]:
+    """
+    This generator yields (header, values) tuples from dict
+    or object, the header is shared by objects of the same
+    class when get_schema returns a schema. Callable values
+    of __dict__ are ignored.
+    """
+
+    schemas = {}
+
+    for object_ in objects:
+        if isinstance(object_, dict):
+            yield tuple(object_), tuple(object_.values())
+            continue
+
+        schema = get_cached_schema(schemas, object_)
+
+        if schema is None:
+            dict_ = {
+                k: v
+                for k, v in object_.__dict__.items()
+                if not isinstance(v, Callable)
+            }
+            yield tuple(dict_), tuple(dict_.values())
+        else:
+            yield get_schema_row(schema, object_)
+
+
+def load_run(file: TextIO) -> Iterator[Any]:
+    """
+    This generator loads objects from a sorted run file.
+    """
+
+    file.seek(0)
+    load_ = partial(load, file)
+
+    while True:
+        try:
+            yield load_()
+        except EOFError:
+            return
+
+
+def external_sort(
+    objects: Iterable[dict],
+    key: Callable = None,
+    reverse: bool = False,
+    run_size: int = 100000,
+    directory: str = None,
+) -> Iterator[dict]:
+    """
+    This generator sorts objects larger than memory: sorted runs
+    of run_size objects are spilled to temporary files and merged
+    with heapq.merge.
+    """
+
+    objects = iter(objects)
+    runs = []
+
+    try:
+        while run := sorted(
+            islice(objects, run_size), key=key, reverse=reverse
+        ):
+            if not runs and len(run) < run_size:
+                yield from run
+                return
+
+            file = TemporaryFile(dir=directory)
+            runs.append(file)
+            for object_ in run:
+                dump(object_, file, HIGHEST_PROTOCOL)
+
+        yield from merge(*map(load_run, runs), key=key, reverse=reverse)
+    finally:
+        for file in runs:
+            file.close()
+
+
+def write_text(
+    objects: Iterable[Union[dict, object]],
+    file: TextIO,
+    length: Union[Sequence[int], int] = 13,
+    end: str = "...",
+    separator: str = "|",
+) -> int:
+    """
+    This function writes a text table of objects (see get_rows)
+    in file and returns the number of objects.
+
+    length, end and separator are sent to StringF.TableFormatter
+    """
+
+    rows = get_rows(objects)
+    first = next(rows, None)
+
+    if first is None:
+        return 0
+
+    header, values = first
+    formatter = TableFormatter(header, length, end, separator)
+    format_row = formatter.format_row
+    write = file.write
+
+    write(formatter.format_header())
+    write("\n")
+    write(format_row(values))
+
+    counter = 1
+    for counter, (_, values) in enumerate(rows, 2):
+        write("\n")
+        write(format_row(values))
+
+    return counter
+
+
+def write_HTML(
+    objects: Iterable[Union[dict, object]], file: TextIO
+) -> int:
+    """
+    This function writes a HTML table of objects (see get_rows)
+    in file and returns the number of objects.
+    """
+
+    rows = get_rows(objects)
+    first = next(rows, None)
+
+    if first is None:
+        return 0
+
+    write = file.write
+    write(
+        "<table><thead><tr><th>"
+        + "</th><th>".join(str(k) for k in first[0])
+        + "</th></tr></thead><tbody>"
+    )
+
+    counter = 0
+    for counter, (_, values) in enumerate(chain((first,), rows), 1):
+        write(
+            "<tr><td>"
+            + "</td><td>".join(str(v) for v in values)
+            + "</td></tr>"
+        )
+
+    write("</tbody><tfoot></tfoot></table>")
+    return counter
+
+
+def write_JSON(
+    objects: Iterable[dict], file: TextIO, *args, indent: int = 4, **kwargs
+) -> int:
+    """
+    This function writes a JSON array of objects in file
+    and returns the number of objects.
+
+    *args and **kwargs are sent to json.dumps
+    """
+
+    objects = iter(objects)
+    first = next(objects, None)
+
+    if first is None:
+        return 0
+
+    write = file.write
+
+    if indent is None:
+        start, separator, end = "[", ", ", "]"
+    else:
+        indent_string = " " * indent if isinstance(indent, int) else indent
+        start = "[\n" + indent_string
+        separator = ",\n" + indent_string
+        end = "\n]"
+
+    write(start)
+
+    counter = 0
+    for counter, object_ in enumerate(chain((first,), objects), 1):
+        if counter != 1:
+            write(separator)
+
+        json = dumps(object_, *args, indent=indent, **kwargs)
+        write(json if indent is None else json.replace("\n", separator[1:]))
+
+    write(end)
+    return counter
+
+
+def write_CSV(objects: Iterable[dict], file: TextIO, *args, **kwargs) -> int:
+    """
+    This function writes a CSV content of objects in file
+    and returns the number of objects.
+
+    *args and **kwargs are sent to DictWriter
+    """
+
+    objects = iter(objects)
+    first = next(objects, None)
+
+    if first is None:
+        return 0
+
+    csv_report = DictWriter(file, fieldnames=first.keys(), *args, **kwargs)
+    csv_report.writeheader()
+    csv_report.writerow(first)
+
+    counter = 1
+    for counter, object_ in enumerate(objects, 2):
+        csv_report.writerow(object_)
+
+    return counter
+
+
+writers = {
+    "text": write_text,
+    "HTML": write_HTML,
+    "JSON": write_JSON,
+    "CSV": write_CSV,
+}
+
+
+def open_compressed(
+    path: str, compression: str = None, binary: bool = False
+) -> Union[TextIO, BinaryIO]:
+    """
+    This function opens a file to write a report, compression
+    can be None, "gzip" or "zstd".
+    """
+
+    mode = "wb" if binary else "wt"
+    kwargs = {} if binary else {"encoding": "utf-8", "newline": ""}
+
+    if compression is None:
+        return open(path, mode, **kwargs)
+
+    if compression == "gzip":
+        return gzip.open(path, mode, **kwargs)
+
+    if compression == "zstd":
+        if not ZSTANDARD:
+            raise ImportError(
+                "zstandard should be installed to use zstd compression.\n"
+                f"You can install it with: {executable} -m pip install "
+                "zstandard"
+            )
+        return zstandard.open(path, mode, **kwargs)
+
+    raise ValueError(f"Invalid compression: {compression!r}")
+
+
+def write_file(
+    objects: Iterable[dict],
+    path: str,
+    *args,
+    format: str = "CSV",
+    compression: str = None,
+    **kwargs,
+) -> int:
+    """
+    This function writes a (compressed) report file and returns
+    the number of objects, format can be "text", "HTML", "JSON"
+    or "CSV".
+
+    *args and **kwargs are sent to the writer function.
+    """
+
+    function = writers.get(format)
+
+    if function is None:
+        raise ValueError(f"Invalid format: {format!r}")
+
+    with open_compressed(path, compression) as file:
+        return function(objects, file, *args, **kwargs)
+
+
+def to_little_endian(column: array) -> bytes:
+    """
+    This function returns little endian bytes for an array.
+    """
+
+    if byteorder == "big":
+        column.byteswap()
+
+    return column.tobytes()
+
+
+def encode_column(values: Sequence[Any]) -> Tuple[bytes, bytes]:
+    """
+    This function returns the type code and the payload
+    of a column for the built-in columnar format.
+    """
+
+    types = set(map(type, values))
+
+    if types == {int}:
+        try:
+            return b"q", to_little_endian(array("q", values))
+        except OverflowError:
+            pass
+    elif types == {float}:
+        return b"d", to_little_endian(array("d", values))
+
+    if types == {str}:
+        code = b"s"
+        strings = values
+    else:
+        code = b"j"
+        strings = [dumps(value, default=str) for value in values]
+
+    encoded = [string.encode("utf-8") for string in strings]
+    offsets = array("Q", accumulate(map(len, encoded)))
+    return code, to_little_endian(offsets) + b"".join(encoded)
+
+
+def decode_column(code: bytes, payload: bytes, count: int) -> List[Any]:
+    """
+    This function returns values of a column from the
+    built-in columnar format.
+    """
+
+    if code in (b"q", b"d"):
+        column = array(code.decode())
+        column.frombytes(payload)
+    else:
+        column = array("Q")
+        column.frombytes(payload[: count * 8])
+
+    if byteorder == "big":
+        column.byteswap()
+
+    if code in (b"q", b"d"):
+        return column.tolist()
+
+    data = payload[count * 8 :]
+    strings = [
+        data[start:end].decode("utf-8")
+        for start, end in zip(chain((0,), column), column)
+    ]
+    return strings if code == b"s" else [loads(x) for x in strings]
+
+
+def write_builtin_columnar(
+    objects: Iterable[Union[dict, object]],
+    file: BinaryIO,
+    batch_size: int = 65536,
+) -> int:
+    """
+    This function writes objects (see get_rows) in the built-in
+    typed columnar format (batches of int64, float64, UTF-8 or
+    JSON columns) and returns the number of objects. A new
+    batch starts when the columns names change.
+    """
+
+    rows = get_rows(objects)
+    write = file.write
+    write(COLUMNAR_MAGIC)
+    counter = 0
+    pending = next(rows, None)
+
+    while pending is not None:
+        names, values = pending
+        batch = [values]
+        append = batch.append
+        pending = None
+
+        for row in rows:
+            header, values = row
+            if header is not names and header != names:
+                pending = row
+                break
+
+            append(values)
+            if len(batch) >= batch_size:
+                pending = next(rows, None)
+                break
+
+        columns = zip(*batch)
+
+        write(pack("<IH", len(batch), len(names)))
+        for name, values in zip(names, columns):
+            name = str(name).encode("utf-8")
+            code, payload = encode_column(values)
+            write(pack("<H", len(name)) + name + code)
+            write(pack("<Q", len(payload)))
+            write(payload)
+
+        counter += len(batch)
+
+    write(pack("<IH", 0, 0))
+    return counter
+
+
+def read_columnar(file: BinaryIO) -> Iterator[dict]:
+    """
+    This generator reads objects from the built-in
+    columnar format.
+    """
+
+    read = file.read
+
+    if read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError("Invalid columnar file")
+
+    while True:
+        count, columns_number = unpack("<IH", read(6))
+
+        if not count:
+            return
+
+        names = []
+        columns = []
+        for _ in range(columns_number):
+            (length,) = unpack("<H", read(2))
+            names.append(read(length).decode("utf-8"))
+            code = read(1)
+            (length,) = unpack("<Q", read(8))
+            columns.append(decode_column(code, read(length), count))
+
+        for values in zip(*columns):
+            yield dict(zip(names, values))
+
+
+def write_arrow(
+    objects: Iterable[dict],
+    path: str,
+    format: str = "parquet",
+    compression: str = None,
+    batch_size: int = 65536,
+) -> int:
+    """
+    This function writes objects in a Parquet or Arrow IPC file
+    using pyarrow and returns the number of objects.
+    """
+
+    objects = iter(objects)
+    writer_ = schema = None
+    counter = 0
+
+    try:
+        while batch := list(islice(objects, batch_size)):
+            record_batch = RecordBatch.from_pylist(batch, schema=schema)
+
+            if writer_ is None:
+                schema = record_batch.schema
+                if format == "parquet":
+                    writer_ = ParquetWriter(
+                        path, schema, compression=compression or "snappy"
+                    )
+                else:
+                    writer_ = ipc.new_file(
+                        path,
+                        schema,
+                        options=ipc.IpcWriteOptions(compression=compression),
+                    )
+
+            if format == "parquet":
+                writer_.write_table(Table.from_batches((record_batch,)))
+            else:
+                writer_.write_batch(record_batch)
+
+            counter += len(batch)
+    finally:
+        if writer_ is not None:
+            writer_.close()
+
+    return counter
+
+
+def write_columnar(
+    objects: Iterable[dict],
+    path: str,
+    format: str = None,
+    compression: str = None,
+    batch_size: int = 65536,
+) -> int:
+    """
+    This function writes a columnar binary report and returns
+    the number of objects, format can be "parquet", "arrow"
+    (pyarrow is required) or "builtin" (default when pyarrow
+    is not installed).
+
+    compression is sent to pyarrow for parquet and arrow
+    formats and to open_compressed for the builtin format.
+    """
+
+    if format is None:
+        format = "parquet" if PYARROW else "builtin"
+
+    if format == "builtin":
+        with open_compressed(path, compression, binary=True) as file:
+            return write_builtin_columnar(objects, file, batch_size)
+
+    if format not in ("parquet", "arrow"):
+        raise ValueError(f"Invalid format: {format!r}")
+
+    if not PYARROW:
+        raise ImportError(
+            "pyarrow should be installed to use parquet and arrow formats."
+            f"\nYou can install it with: {executable} -m pip install pyarrow"
+        )
+
+    return write_arrow(objects, path, format, compression, batch_size)
+
+
+def build_statistic(
+    name: str,
+    total: Union[int, float],
+    max_: Union[int, float],
+    min_: Union[int, float],
+    count: int,
+    max_count: int,
+    min_count: int,
+    average: float,
+    var: Union[int, float],
+    med: Union[int, float],
+    dev: float,
+    count_less: Callable,
+    count_greater: Callable,
+) -> Dict[str, Union[str, int, float]]:
+    """
+    This function builds the statistic dict from accumulated
+    values, count_less and count_greater return the number
+    of values lower and greater than a threshold.
+    """
+
+    statistic = {
+        "Name": name,
+        "Sum": total,
+        "Max": max_,
+        "Min": min_,
+        "Count": count,
+        "MaxCount": max_count,
+        "MinCount": min_count,
+        "Average": average,
+        "Variance": var,
+        "Median": med,
+        "Deviation": dev,
+    }
+
+    for label, threshold in (
+        ("Average", average),
+        ("Variance", var),
+        ("Median", med),
+        ("Deviation", dev),
+    ):
+        statistic["CountGreaterThan" + label] = count_greater(threshold)
+        statistic["CountLessThan" + label] = count_less(threshold)
+
+    return statistic
+
+
+def integer_moments(
+    total: int, squares: int, count: int
+) -> Tuple[float, Union[int, float], float]:
+    """
+    This function returns the average, the sample variance (int
+    when the division is exact) and the population deviation of
+    integers from their exact sum and sum of squares.
+
+    >>> integer_moments(6, 14, 3)
+    (2.0, 1, 0.816496580927726)
+    >>> integer_moments(3, 5, 2)
+    (1.5, 0.5, 0.5)
+    """
+
+    squared_deviations = count * squares - total * total
+    denominator = count * (count - 1)
+    if squared_deviations % denominator:
+        var = squared_deviations / denominator
+    else:
+        var = squared_deviations // denominator
+
+    return (
+        total / count,
+        var,
+        sqrt(squared_deviations / (count * count)),
+    )
+
+
+def values_statistic(
+    name: str, values: Sequence[Union[int, float]]
+) -> Dict[str, Union[str, int, float]]:
+    """
+    This function returns statistics for values: sum, min and max
+    in one pass, average, variance and deviation from exact integer
+    sums (or a two-pass float sum), the median and threshold
+    counters use one sort and bisect.
+
+    >>> statistic = values_statistic("id", range(10**17, 10**17 + 1001))
+    >>> statistic["Average"], statistic["Variance"], statistic["Deviation"]
+    (1.000000000000005e+17, 83583.5, 288.9636655359978)
+    >>> statistic["CountGreaterThanAverage"]
+    504
+    >>> values_statistic("x", [1, 2, 3, 4, 10])["Variance"]
+    12.5
+    >>> values_statistic("x", [1, 3])["Variance"]
+    2
+    """
+
+    count = len(values)
+    if count < 2:
+        raise StatisticsError("variance requires at least two data points")
+
+    total = max_ = min_ = values[0]
+    max_count = min_count = 1
+
+    for index in range(1, count):
+        value = values[index]
+        total += value
+
+        if value > max_:
+            max_ = value
+            max_count = 1
+        elif value == max_:
+            max_count += 1
+
+        if value < min_:
+            min_ = value
+            min_count = 1
+        elif value == min_:
+            min_count += 1
+
+    if all(isinstance(value, int) for value in values):
+        average, var, dev = integer_moments(
+            total, sum(value * value for value in values), count
+        )
+    else:
+        average = fsum(values) / count
+        m2 = fsum((value - average) ** 2 for value in values)
+        var = m2 / (count - 1)
+        dev = sqrt(m2 / count)
+
+    sorted_ = sorted(values)
+    half = count // 2
+    med = (
+        sorted_[half]
+        if count % 2
+        else (sorted_[half - 1] + sorted_[half]) / 2
+    )
+
+    return build_statistic(
+        name,
+        total,
+        max_,
+        min_,
+        count,
+        max_count,
+        min_count,
+        average,
+        var,
+        med,
+        dev,
+        partial(bisect_left, sorted_),
+        lambda x: count - bisect_right(sorted_, x),
+    )
+
+
+def numpy_values_statistic(
+    name: str, values: Sequence[Union[int, float]]
+) -> Dict[str, Union[str, int, float]]:
+    """
+    This function returns statistics for values using NumPy,
+    integers moments are computed from exact Python sums.
+    Values NumPy cannot store as int64 or float64 (object
+    arrays, e.g. integers greater than 2**63) are computed
+    by values_statistic.
+
+    >>> report = Report([{"a": 2 ** 70}, {"a": 1}, {"a": 3}])
+    >>> report.statistic(use_numpy=NUMPY) == report.statistic()
+    True
+    """
+
+    array = np_array(values)
+    if array.dtype.kind not in "iuf":
+        return values_statistic(name, values)
+
+    count = array.size
+    if count < 2:
+        raise StatisticsError("variance requires at least two data points")
+
+    sorted_ = np_sort(array)
+    searchsorted = sorted_.searchsorted
+    min_ = sorted_[0].item()
+    max_ = sorted_[-1].item()
+
+    if array.dtype.kind in "iu":
+        integers = sorted_.tolist()
+        total = sum(integers)
+        average, var, dev = integer_moments(
+            total, sum(value * value for value in integers), count
+        )
+    else:
+        total = array.sum().item()
+        average = total / count
+        m2 = ((array - average) ** 2).sum().item()
+        var = m2 / (count - 1)
+        dev = sqrt(m2 / count)
+
+    half = count // 2
+    med = (
+        sorted_[half].item()
+        if count % 2
+        else (sorted_[half - 1].item() + sorted_[half].item()) / 2
+    )
+
+    return build_statistic(
+        name,
+        total,
+        max_,
+        min_,
+        count,
+        count - int(searchsorted(max_, "left")),
+        int(searchsorted(min_, "right")),
+        average,
+        var,
+        med,
+        dev,
+        lambda x: int(searchsorted(x, "left")),
+        lambda x: count - int(searchsorted(x, "right")),
+    )
+
+
 class ReportDict:
 
     """
@@ -211,16 +1149,16 @@ class ReportDict:
         key, value = columns = self.columns
         keys = list(data.keys())
         values = list(data.values())
-        max_str = lambda x: max(len(str(y)) for y in x)
+        max_str = lambda x: max(string_width(str(y)) for y in x)
 
         max_keys = max_str(keys)
         max_values = max_str(values)
 
-        value_length = len(value) + 1
+        value_length = string_width(value) + 1
         if max_values < value_length:
             max_values = value_length
 
-        key_length = len(key) + 1
+        key_length = string_width(key) + 1
         if max_keys < key_length:
             max_keys = key_length
 
@@ -230,6 +1168,22 @@ class ReportDict:
             length=(max_keys, max_values),
         )
 
+    def report_stream(
+        self, file: TextIO = None, sample_size: int = 100, **kwargs
+    ) -> int:
+        """
+        This function writes dict as text (Markdown) in file
+        (default: sys.stdout) without computing the length
+        of all values, widths are computed from the columns
+        names and the first sample_size items.
+
+        **kwargs are sent to StringF.stream_tableformat
+        """
+
+        return stream_tableformat(
+            self.data.items(), file, self.columns, sample_size, **kwargs
+        )
+
     def report_CSV(self, *args, **kwargs) -> str:
         """
         This function reports dict as CSV.
@@ -318,15 +1272,34 @@ class Report:
         This function returns dict from dict or object.
         """
 
+        schemas = {}
+
         for object_ in objects:
             if isinstance(object_, dict):
                 yield object_
-            else:
+                continue
+
+            schema = get_cached_schema(schemas, object_)
+
+            if schema is None:
                 yield {
                     k: v
                     for k, v in object_.__dict__.items()
                     if not isinstance(v, Callable)
                 }
+            else:
+                yield dict(zip(*get_schema_row(schema, object_)))
+
+    @staticmethod
+    def get_rows(
+        objects: Union[Sequence[dict], Sequence[object]]
+    ) -> Iterator[Tuple[Tuple[str, ...], tuple]]:
+        """
+        This function returns (header, values) tuples from dict
+        or object (see get_rows).
+        """
+
+        return get_rows(objects)
 
     def frequence(
         self, filtered: bool = False, pourcent: bool = True
@@ -355,7 +1328,7 @@ class Report:
         This function returns a text table to report
         objects.
 
-        *args and **kwargs are sent to StringF.strings_tableformat
+        *args and **kwargs are sent to write_text
         """
 
         objects = self.filtered if filtered else self.objects
@@ -363,11 +1336,9 @@ class Report:
         if not objects:
             return None
 
-        columns = objects[0].keys()
-
-        return strings_tableformat(
-            [o.values() for o in objects], columns=columns, *args, **kwargs
-        )
+        report = StringIO()
+        write_text(objects, report, *args, **kwargs)
+        return report.getvalue()
 
     def report_HTML(self, filtered: bool = False):
         """
@@ -380,22 +1351,9 @@ class Report:
         if not objects:
             return None
 
-        columns = (
-            "<thead><tr><th>"
-            + "</th><th>".join(str(k) for k in objects[0].keys())
-            + "</th></tr></thead>"
-        )
-
-        last_index = len(objects) - 1
-        body = "<tbody><tr><td>"
-
-        for i, object_ in enumerate(objects):
-            body += "</td><td>".join(str(v) for v in object_.values())
-            body += f"</td></tr>{'<tr><td>' if i != last_index else ''}"
-
-        body += "</tbody><tfoot></tfoot>"
-
-        return f"<table>{columns}{body}</table>"
+        report = StringIO()
+        write_HTML(objects, report)
+        return report.getvalue()
 
     def report_JSON(
         self, *args, filtered: bool = False, indent: int = 4, **kwargs
@@ -427,20 +1385,71 @@ class Report:
         if not objects:
             return None
 
-        fieldnames = objects[0].keys()
-
         report = StringIO()
-        csv_report = DictWriter(report, fieldnames=fieldnames, *args, **kwargs)
-        csv_report.writeheader()
-        csv_report.writerows(objects)
+        write_CSV(objects, report, *args, **kwargs)
         return report.getvalue()
 
+    def report_file(
+        self,
+        path: str,
+        *args,
+        format: str = "CSV",
+        compression: str = None,
+        filtered: bool = False,
+        **kwargs,
+    ) -> int:
+        """
+        This function writes a (compressed) report file and
+        returns the number of objects.
+
+        *args and **kwargs are sent to the writer function.
+        """
+
+        objects = (self.filtered if filtered else self.objects) or ()
+        return write_file(
+            objects,
+            path,
+            *args,
+            format=format,
+            compression=compression,
+            **kwargs,
+        )
+
+    def report_columnar(
+        self,
+        path: str,
+        format: str = None,
+        compression: str = None,
+        filtered: bool = False,
+        batch_size: int = 65536,
+    ) -> int:
+        """
+        This function writes a columnar binary report (Parquet,
+        Arrow IPC or built-in format) and returns the number
+        of objects.
+        """
+
+        objects = (self.filtered if filtered else self.objects) or ()
+        return write_columnar(objects, path, format, compression, batch_size)
+
     def statistic(
-        self, attributes: Sequence[str] = None, filtered: bool = False
+        self,
+        attributes: Sequence[str] = None,
+        filtered: bool = False,
+        workers: int = None,
+        use_numpy: bool = False,
     ) -> List[Dict[str, Union[str, int]]]:
         """
         This function returns statistics to report
         objects statistics.
+
+        workers is the number of parallel workers to
+        compute attributes statistics (processes, or
+        threads when use_numpy is True). Each column is
+        pickled to be sent to a process: processes are
+        faster only when statistics of a column cost more
+        than its transfer (long columns on many cores),
+        with few or short columns keep workers to None.
         """
 
         objects = self.filtered if filtered else self.objects
@@ -448,74 +1457,192 @@ class Report:
         if not objects:
             return None
 
+        if use_numpy and not NUMPY:
+            raise ImportError(
+                "NumPy should be installed to use use_numpy.\n"
+                f"You can install it with: {executable} -m pip install numpy"
+            )
+
         if attributes is None:
             attributes = [
                 k for k, v in objects[0].items() if isinstance(v, int)
             ]
 
-        data = {a: [] for a in attributes}
+        if not attributes:
+            return []
 
-        for object_ in objects:
-            for attribute in attributes:
-                data[attribute].append(object_[attribute])
-
-        statistics = []
-        for attribute, values in data.items():
-            statistic = {}
-            statistics.append(statistic)
-
-            statistic["Name"] = attribute
-            statistic["Sum"] = sum(values)
-            max_ = statistic["Max"] = max(values)
-            min_ = statistic["Min"] = min(values)
-            statistic["Count"] = len(values)
-            statistic["MaxCount"] = values.count(max_)
-            statistic["MinCount"] = values.count(min_)
-            average = statistic["Average"] = fmean(values)
-            var = statistic["Variance"] = variance(values)
-            med = statistic["Median"] = median(values)
-            dev = statistic["Deviation"] = pstdev(values)
-
-            gt_average = 0
-            lt_average = 0
-            gt_variance = 0
-            lt_variance = 0
-            gt_median = 0
-            lt_median = 0
-            gt_deviation = 0
-            lt_deviation = 0
-
-            for value in values:
-                if value > average:
-                    gt_average += 1
-                elif value < average:
-                    lt_average += 1
-
-                if value > var:
-                    gt_variance += 1
-                elif value < var:
-                    lt_variance += 1
-
-                if value > med:
-                    gt_median += 1
-                elif value < med:
-                    lt_median += 1
-
-                if value > dev:
-                    gt_deviation += 1
-                elif value < dev:
-                    lt_deviation += 1
-
-            statistic["CountGreaterThanAverage"] = gt_average
-            statistic["CountLessThanAverage"] = lt_average
-            statistic["CountGreaterThanVariance"] = gt_variance
-            statistic["CountLessThanVariance"] = lt_variance
-            statistic["CountGreaterThanMedian"] = gt_median
-            statistic["CountLessThanMedian"] = lt_median
-            statistic["CountGreaterThanDeviation"] = gt_deviation
-            statistic["CountLessThanDeviation"] = lt_deviation
-
-        return statistics
+        getter = itemgetter(*attributes)
+        columns = (
+            list(zip(*map(getter, objects)))
+            if len(attributes) > 1
+            else [[getter(object_) for object_ in objects]]
+        )
+
+        function = numpy_values_statistic if use_numpy else values_statistic
+
+        if workers:
+            Executor = ThreadPoolExecutor if use_numpy else ProcessPoolExecutor
+            with Executor(workers) as executor:
+                return list(executor.map(function, attributes, columns))
+
+        return list(map(function, attributes, columns))
+
+
+class StreamReport:
+
+    """
+    This class reports data larger than memory in different
+    formats, objects are filtered in a generator stage and
+    sorted with an external merge sort.
+
+    objects is iterated for each report, use a re-iterable
+    object to write multiple reports.
+    """
+
+    def __init__(
+        self,
+        objects: Union[Iterable[dict], Iterable[object]],
+        sort_value: Union[str, Callable] = None,
+        filter_value: Union[str, Callable] = None,
+        reverse: bool = False,
+        run_size: int = 100000,
+        directory: str = None,
+    ):
+        self.objects = objects
+        self.reverse = reverse
+        self.run_size = run_size
+        self.directory = directory
+
+        if isinstance(filter_value, str):
+            filter_value = partial(
+                default_key_function, attribute=filter_value
+            )
+
+        if isinstance(sort_value, str):
+            sort_value = partial(default_key_function, attribute=sort_value)
+
+        self.filter_value = filter_value
+        self.sort_value = sort_value
+
+    def get_objects(self, filtered: bool = False) -> Iterator[dict]:
+        """
+        This function returns the filtered and sorted stream
+        of objects.
+        """
+
+        objects = Report.get_dicts(self.objects)
+        filter_value = self.filter_value
+
+        if filter_value is not None:
+            objects = (filterfalse if filtered else filter)(
+                filter_value, objects
+            )
+        elif filtered:
+            return iter(())
+
+        if self.sort_value is not None:
+            objects = external_sort(
+                objects,
+                self.sort_value,
+                self.reverse,
+                self.run_size,
+                self.directory,
+            )
+
+        return objects
+
+    def report_text(
+        self, file: TextIO, *args, filtered: bool = False, **kwargs
+    ) -> int:
+        """
+        This function writes a text table in file to report
+        objects and returns the number of objects.
+
+        *args and **kwargs are sent to write_text
+        """
+
+        return write_text(self.get_objects(filtered), file, *args, **kwargs)
+
+    def report_HTML(self, file: TextIO, filtered: bool = False) -> int:
+        """
+        This function writes a HTML table in file to report
+        objects and returns the number of objects.
+        """
+
+        return write_HTML(self.get_objects(filtered), file)
+
+    def report_JSON(
+        self,
+        file: TextIO,
+        *args,
+        filtered: bool = False,
+        indent: int = 4,
+        **kwargs,
+    ) -> int:
+        """
+        This function writes a JSON array in file to report
+        objects and returns the number of objects.
+
+        *args and **kwargs are sent to json.dumps
+        """
+
+        return write_JSON(
+            self.get_objects(filtered), file, *args, indent=indent, **kwargs
+        )
+
+    def report_CSV(
+        self, file: TextIO, *args, filtered: bool = False, **kwargs
+    ) -> int:
+        """
+        This function writes a CSV content in file to report
+        objects and returns the number of objects.
+
+        *args and **kwargs are sent to DictWriter
+        """
+
+        return write_CSV(self.get_objects(filtered), file, *args, **kwargs)
+
+    def report_file(
+        self,
+        path: str,
+        *args,
+        format: str = "CSV",
+        compression: str = None,
+        filtered: bool = False,
+        **kwargs,
+    ) -> int:
+        """
+        This function writes a (compressed) report file and
+        returns the number of objects.
+
+        *args and **kwargs are sent to the writer function.
+        """
+
+        return write_file(
+            self.get_objects(filtered),
+            path,
+            *args,
+            format=format,
+            compression=compression,
+            **kwargs,
+        )
+
+    def report_columnar(
+        self,
+        path: str,
+        format: str = None,
+        compression: str = None,
+        filtered: bool = False,
+        batch_size: int = 65536,
+    ) -> int:
+        """
+        This function writes a columnar binary report (Parquet,
+        Arrow IPC or built-in format) and returns the number
+        of objects.
+        """
+
+        objects = self.get_objects(filtered)
+        return write_columnar(objects, path, format, compression, batch_size)
 
 
 if __name__ == "__main__":
@@ -53,6 +53,15 @@ A
 |a            |a            |
 |b            |b            |
 |azerty       |1.1          |
+>>> formatter = TableFormatter(["name", "value"], [5, 8])
+>>> print(formatter.format([("abcdefgh", 1.5), ("abc", 2)]))
+|name |value   |
+|-----|--------|
+|ab...|1.5     |
+|abc  |2       |
+>>> print(strings_tableformat([("\u65e5\u672c\u8a9e", 1), ("\u65e5\u672c\u8a9e" * 3, 2)], length=7))
+|\u65e5\u672c\u8a9e |1      |
+|\u65e5\u672c...|2      |
 >>>
 
 Run tests:
@@ -97,10 +106,178 @@ under certain conditions.
 __license__ = license
 __copyright__ = copyright
 
-__all__ = ["string_lengthformat", "strings_tableformat", "Object_StringF"]
+__all__ = [
+    "string_lengthformat",
+    "strings_tableformat",
+    "Object_StringF",
+    "TableFormatter",
+    "stream_tableformat",
+    "string_width",
+]
+
+from collections.abc import Iterator, Iterable, Sequence
+from typing import Union, Tuple, Any, TextIO
+from itertools import chain, islice
+from functools import lru_cache
+from bisect import bisect_right
+import sys
+
+# Display width changes over code points (Unicode 14): each item is
+# the first code point (hexadecimal) of a range with width 1, "_" marks
+# zero width ranges (combining marks, format characters) and "+" wide
+# ranges (East Asian Wide and Fullwidth characters).
+UNICODE_WIDTHS = (
+    "0 300_ 370 483_ 48a 591_ 5be 5bf_ 5c0 5c1_ 5c3 5c4_ 5c6 5c7_ 5d0 600_ "
+    "606 610_ 61b 61c_ 61d 64b_ 660 670_ 671 6d6_ 6de 6df_ 6e5 6e7_ 6e9 "
+    "6ea_ 6ee 70f_ 710 711_ 712 730_ 74d 7a6_ 7b1 7eb_ 7f4 7fd_ 7fe 816_ "
+    "81a 81b_ 824 825_ 828 829_ 830 859_ 85e 890_ 8a0 8ca_ 903 93a_ 93b "
+    "93c_ 93d 941_ 949 94d_ 94e 951_ 958 962_ 964 981_ 982 9bc_ 9bd 9c1_ "
+    "9c7 9cd_ 9ce 9e2_ 9e6 9fe_ a03 a3c_ a3e a41_ a59 a70_ a72 a75_ a76 "
+    "a81_ a83 abc_ abd ac1_ ac9 acd_ ad0 ae2_ ae6 afa_ b02 b3c_ b3d b3f_ "
+    "b40 b41_ b47 b4d_ b57 b62_ b66 b82_ b83 bc0_ bc1 bcd_ bd0 c00_ c01 "
+    "c04_ c05 c3c_ c3d c3e_ c41 c46_ c58 c62_ c66 c81_ c82 cbc_ cbd cbf_ "
+    "cc0 cc6_ cc7 ccc_ cd5 ce2_ ce6 d00_ d02 d3b_ d3d d41_ d46 d4d_ d4e "
+    "d62_ d66 d81_ d82 dca_ dcf dd2_ dd8 e31_ e32 e34_ e3f e47_ e4f eb1_ "
+    "eb2 eb4_ ebd ec8_ ed0 f18_ f1a f35_ f36 f37_ f38 f39_ f3a f71_ f7f "
+    "f80_ f85 f86_ f88 f8d_ fbe fc6_ fc7 102d_ 1031 1032_ 1038 1039_ 103b "
+    "103d_ 103f 1058_ 105a 105e_ 1061 1071_ 1075 1082_ 1083 1085_ 1087 "
+    "108d_ 108e 109d_ 109e 1100+ 1160_ 1200 135d_ 1360 1712_ 1715 1732_ "
+    "1734 1752_ 1760 1772_ 1780 17b4_ 17b6 17b7_ 17be 17c6_ 17c7 17c9_ 17d4 "
+    "17dd_ 17e0 180b_ 1810 1885_ 1887 18a9_ 18aa 1920_ 1923 1927_ 1929 "
+    "1932_ 1933 1939_ 1940 1a17_ 1a19 1a1b_ 1a1e 1a56_ 1a57 1a58_ 1a61 "
+    "1a62_ 1a63 1a65_ 1a6d 1a73_ 1a80 1ab0_ 1b04 1b34_ 1b35 1b36_ 1b3b "
+    "1b3c_ 1b3d 1b42_ 1b43 1b6b_ 1b74 1b80_ 1b82 1ba2_ 1ba6 1ba8_ 1baa "
+    "1bab_ 1bae 1be6_ 1be7 1be8_ 1bea 1bed_ 1bee 1bef_ 1bf2 1c2c_ 1c34 "
+    "1c36_ 1c3b 1cd0_ 1cd3 1cd4_ 1ce1 1ce2_ 1ce9 1ced_ 1cee 1cf4_ 1cf5 "
+    "1cf8_ 1cfa 1dc0_ 1e00 200b_ 2010 202a_ 202f 2060_ 2070 20d0_ 2100 "
+    "231a+ 231c 2329+ 232b 23e9+ 23ed 23f0+ 23f1 23f3+ 23f4 25fd+ 25ff "
+    "2614+ 2616 2648+ 2654 267f+ 2680 2693+ 2694 26a1+ 26a2 26aa+ 26ac "
+    "26bd+ 26bf 26c4+ 26c6 26ce+ 26cf 26d4+ 26d5 26ea+ 26eb 26f2+ 26f4 "
+    "26f5+ 26f6 26fa+ 26fb 26fd+ 26fe 2705+ 2706 270a+ 270c 2728+ 2729 "
+    "274c+ 274d 274e+ 274f 2753+ 2756 2757+ 2758 2795+ 2798 27b0+ 27b1 "
+    "27bf+ 27c0 2b1b+ 2b1d 2b50+ 2b51 2b55+ 2b56 2cef_ 2cf2 2d7f_ 2d80 "
+    "2de0_ 2e00 2e80+ 302a_ 302e+ 303f 3041+ 3099_ 309b+ 3248 3250+ 4dc0 "
+    "4e00+ a4d0 a66f_ a673 a674_ a67e a69e_ a6a0 a6f0_ a6f2 a802_ a803 "
+    "a806_ a807 a80b_ a80c a825_ a827 a82c_ a830 a8c4_ a8ce a8e0_ a8f2 "
+    "a8ff_ a900 a926_ a92e a947_ a952 a960+ a980_ a983 a9b3_ a9b4 a9b6_ "
+    "a9ba a9bc_ a9be a9e5_ a9e6 aa29_ aa2f aa31_ aa33 aa35_ aa40 aa43_ aa44 "
+    "aa4c_ aa4d aa7c_ aa7d aab0_ aab1 aab2_ aab5 aab7_ aab9 aabe_ aac0 "
+    "aac1_ aac2 aaec_ aaee aaf6_ ab01 abe5_ abe6 abe8_ abe9 abed_ abf0 "
+    "ac00+ d7b0 f900+ fb00 fb1e_ fb1f fe00_ fe10+ fe20_ fe30+ fe70 feff_ "
+    "ff01+ ff61 ffe0+ ffe8 fff9_ fffc 101fd_ 10280 102e0_ 102e1 10376_ "
+    "10380 10a01_ 10a10 10a38_ 10a40 10ae5_ 10aeb 10d24_ 10d30 10eab_ 10ead "
+    "10f46_ 10f51 10f82_ 10f86 11001_ 11002 11038_ 11047 11070_ 11071 "
+    "11073_ 11075 1107f_ 11082 110b3_ 110b7 110b9_ 110bb 110bd_ 110be "
+    "110c2_ 110d0 11100_ 11103 11127_ 1112c 1112d_ 11136 11173_ 11174 "
+    "11180_ 11182 111b6_ 111bf 111c9_ 111cd 111cf_ 111d0 1122f_ 11232 "
+    "11234_ 11235 11236_ 11238 1123e_ 11280 112df_ 112e0 112e3_ 112f0 "
+    "11300_ 11302 1133b_ 1133d 11340_ 11341 11366_ 11400 11438_ 11440 "
+    "11442_ 11445 11446_ 11447 1145e_ 1145f 114b3_ 114b9 114ba_ 114bb "
+    "114bf_ 114c1 114c2_ 114c4 115b2_ 115b8 115bc_ 115be 115bf_ 115c1 "
+    "115dc_ 11600 11633_ 1163b 1163d_ 1163e 1163f_ 11641 116ab_ 116ac "
+    "116ad_ 116ae 116b0_ 116b6 116b7_ 116b8 1171d_ 11720 11722_ 11726 "
+    "11727_ 11730 1182f_ 11838 11839_ 1183b 1193b_ 1193d 1193e_ 1193f "
+    "11943_ 11944 119d4_ 119dc 119e0_ 119e1 11a01_ 11a0b 11a33_ 11a39 "
+    "11a3b_ 11a3f 11a47_ 11a50 11a51_ 11a57 11a59_ 11a5c 11a8a_ 11a97 "
+    "11a98_ 11a9a 11c30_ 11c3e 11c3f_ 11c40 11c92_ 11ca9 11caa_ 11cb1 "
+    "11cb2_ 11cb4 11cb5_ 11d00 11d31_ 11d46 11d47_ 11d50 11d90_ 11d93 "
+    "11d95_ 11d96 11d97_ 11d98 11ef3_ 11ef5 13430_ 14400 16af0_ 16af5 "
+    "16b30_ 16b37 16f4f_ 16f50 16f8f_ 16f93 16fe0+ 16fe4_ 16ff0+ 1bc00 "
+    "1bc9d_ 1bc9f 1bca0_ 1cf50 1d167_ 1d16a 1d173_ 1d183 1d185_ 1d18c "
+    "1d1aa_ 1d1ae 1d242_ 1d245 1da00_ 1da37 1da3b_ 1da6d 1da75_ 1da76 "
+    "1da84_ 1da85 1da9b_ 1df00 1e000_ 1e100 1e130_ 1e137 1e2ae_ 1e2c0 "
+    "1e2ec_ 1e2f0 1e8d0_ 1e900 1e944_ 1e94b 1f004+ 1f005 1f0cf+ 1f0d1 "
+    "1f18e+ 1f18f 1f191+ 1f19b 1f200+ 1f321 1f32d+ 1f336 1f337+ 1f37d "
+    "1f37e+ 1f394 1f3a0+ 1f3cb 1f3cf+ 1f3d4 1f3e0+ 1f3f1 1f3f4+ 1f3f5 "
+    "1f3f8+ 1f43f 1f440+ 1f441 1f442+ 1f4fd 1f4ff+ 1f53e 1f54b+ 1f54f "
+    "1f550+ 1f568 1f57a+ 1f57b 1f595+ 1f597 1f5a4+ 1f5a5 1f5fb+ 1f650 "
+    "1f680+ 1f6c6 1f6cc+ 1f6cd 1f6d0+ 1f6d3 1f6d5+ 1f6e0 1f6eb+ 1f6f0 "
+    "1f6f4+ 1f700 1f7e0+ 1f800 1f90c+ 1f93b 1f93c+ 1f946 1f947+ 1fa00 "
+    "1fa70+ 1fb00 20000+ e0001_ f0000"
+)
+
+UNICODE_STARTS = []
+UNICODE_RANGE_WIDTHS = []
+
+for range_ in UNICODE_WIDTHS.split():
+    if range_[-1] == "_":
+        UNICODE_STARTS.append(int(range_[:-1], 16))
+        UNICODE_RANGE_WIDTHS.append(0)
+    elif range_[-1] == "+":
+        UNICODE_STARTS.append(int(range_[:-1], 16))
+        UNICODE_RANGE_WIDTHS.append(2)
+    else:
+        UNICODE_STARTS.append(int(range_, 16))
+        UNICODE_RANGE_WIDTHS.append(1)
+
+
+def character_width(character: str) -> int:
+    """
+    This function returns the display width of a character.
+    """
+
+    return UNICODE_RANGE_WIDTHS[
+        bisect_right(UNICODE_STARTS, ord(character)) - 1
+    ]
+
+
+@lru_cache(maxsize=4096)
+def unicode_width(string: str) -> int:
+    """
+    This function returns the display width of a non-ASCII string.
+    """
+
+    return sum(map(character_width, string))
+
+
+def string_width(string: str) -> int:
+    """
+    This function returns the display width of a string
+    (wide characters use 2 columns, combining characters 0).
+
+    >>> string_width("azerty")
+    6
+    >>> string_width("\u65e5\u672c\u8a9e")
+    6
+    >>> string_width("e\u0301")
+    1
+    >>>
+    """
+
+    return len(string) if string.isascii() else unicode_width(string)
+
+
+def truncate_width(string: str, width: int) -> str:
+    """
+    This function returns the longest start of string
+    with a display width lower or equal to width.
+    """
+
+    if string.isascii():
+        return string[:width] if width > 0 else ""
+
+    size = 0
+    for index, character in enumerate(string):
+        size += character_width(character)
+        if size > width:
+            return string[:index]
+
+    return string
 
-from collections.abc import Iterator, Sequence
-from typing import Union
+
+def fit_width(string: str, width: int, index: int, end: str) -> str:
+    """
+    This function pads or truncates string to width
+    display columns, truncated strings end with end.
+    """
+
+    string_size = string_width(string)
+
+    if string_size <= width:
+        return string + " " * (width - string_size)
+
+    start = truncate_width(string, index)
+    return start + " " * (index - string_width(start)) + end
 
 
 def string_lengthformat(
@@ -119,6 +296,11 @@ def string_lengthformat(
     if not isinstance(string, str):
         string = str(string)
 
+    if not string.isascii():
+        index = length - len(end)
+        string = fit_width(string, length, index if index > 0 else 0, "...")
+        return string + separator
+
     length_string = len(string)
 
     if length_string > length:
@@ -153,51 +335,227 @@ def strings_tableformat(
     >>>
     """
 
-    table = []
+    return TableFormatter(columns, length, end, separator).format(strings)
 
-    if not isinstance(length, int):
-        llength = len(length)
 
-        global counter
-        counter = 0
+class TableFormatter:
 
-        def get_length():
-            global counter
-            value = length[counter % llength]
-            counter += 1
-            return value
-
-    else:
-
-        def get_length():
-            return length
-
-    if columns is not None:
-        first_line = [separator]
-        second_line = [separator]
+    """
+    This class formats table rows with precomputed
+    (width, truncation index, end) per column, it does not
+    use global state so tables can be formatted concurrently.
+    Cells widths are display widths (see string_width).
+
+    >>> formatter = TableFormatter(["name", "value"], [5, 8])
+    >>> print(formatter.format_header())
+    |name |value   |
+    |-----|--------|
+    >>> formatter.format_row(("abcdefgh", 1.5))
+    '|ab...|1.5     |'
+    >>>
+    """
 
-        for string in columns:
-            size = get_length()
-            first_line.append(
-                string_lengthformat(string, size, end, separator)
+    def __init__(
+        self,
+        columns: Iterable[str] = None,
+        widths: Union[Sequence[int], int] = 13,
+        end: str = "...",
+        separator: str = "|",
+    ):
+        self.columns = None if columns is None else tuple(columns)
+        self.widths = (widths,) if isinstance(widths, int) else tuple(widths)
+        self.separator = separator
+        self.end = end
+        self.templates = {}
+
+        self.get_template(
+            len(self.widths) if self.columns is None else len(self.columns)
+        )
+
+    def get_template(
+        self, size: int
+    ) -> Tuple[str, int, bool, str, Tuple[Tuple[int, int, str], ...]]:
+        """
+        This function returns, for rows of size cells, the
+        precompiled padding template, the length of a row without
+        truncation, whether the separator is ASCII, the plain
+        template and the (width, truncation index, end) of each
+        column.
+        """
+
+        template = self.templates.get(size)
+
+        if template is not None:
+            return template
+
+        widths = self.widths
+        number = len(widths)
+        widths = [widths[index % number] for index in range(size)]
+        separator = self.separator
+        escaped = separator.replace("{", "{{").replace("}", "}}")
+        end = self.end
+        length_end = len(end)
+
+        template = self.templates[size] = (
+            escaped + "".join(f"{{:<{width}}}{escaped}" for width in widths),
+            len(separator) * (size + 1) + sum(widths),
+            separator.isascii(),
+            escaped + f"{{}}{escaped}" * size,
+            tuple(
+                (width, width - length_end, end)
+                if width > length_end
+                else (width, width, "")
+                for width in widths
+            ),
+        )
+        return template
+
+    def format_row(self, row: Iterable[Any]) -> str:
+        """
+        This function returns a formatted row: one call of the
+        padding template when all cells are ASCII (truncated
+        first when they are too long), the display width loop
+        for rows with non-ASCII cells.
+        """
+
+        if row.__class__ is not tuple and row.__class__ is not list:
+            row = tuple(row)
+
+        size = len(row)
+        template, length, ascii_separator, plain, limits = (
+            self.templates.get(size) or self.get_template(size)
+        )
+        cells = [cell if cell.__class__ is str else str(cell) for cell in row]
+        line = template.format(*cells)
+
+        if line.isascii() if ascii_separator else all(map(str.isascii, cells)):
+            if len(line) == length:
+                return line
+
+            return template.format(
+                *[
+                    cell if len(cell) <= width else cell[:index] + end
+                    for cell, (width, index, end) in zip(cells, limits)
+                ]
             )
-            second_line.append(
-                string_lengthformat("-" * size, size, end, separator)
+
+        return plain.format(
+            *[
+                (
+                    cell.ljust(width)
+                    if len(cell) <= width
+                    else cell[:index] + end
+                )
+                if cell.isascii()
+                else fit_width(cell, width, index, end)
+                for cell, (width, index, end) in zip(cells, limits)
+            ]
+        )
+
+    def format_header(self) -> str:
+        """
+        This function returns columns names and the
+        delimiter line.
+        """
+
+        columns = self.columns
+        widths = self.widths
+        number = len(widths)
+
+        return "\n".join(
+            (
+                self.format_row(columns),
+                self.format_row(
+                    "-" * widths[index % number]
+                    for index in range(len(columns))
+                ),
             )
+        )
 
-        table.append(first_line)
-        table.append(second_line)
+    def format(self, rows: Iterable[Iterable[Any]]) -> str:
+        """
+        This function returns the formatted table.
+        """
 
-    for string_iter in strings:
-        line = [separator]
-        for string in string_iter:
-            line.append(
-                string_lengthformat(string, get_length(), end, separator)
-            )
+        table = [] if self.columns is None else [self.format_header()]
+        table.extend(map(self.format_row, rows))
+        return "\n".join(table)
 
-        table.append(line)
 
-    return "\n".join(["".join(strings) for strings in table])
+def stream_tableformat(
+    strings: Iterable[Iterable[Any]],
+    file: TextIO = None,
+    columns: Iterable[str] = None,
+    sample_size: int = 100,
+    max_width: int = None,
+    end: str = "...",
+    separator: str = "|",
+    buffer_size: int = 65536,
+) -> int:
+    """
+    This function writes a formatted table of strings in file
+    (default: sys.stdout) and returns the number of rows.
+
+    Column widths are computed from the columns names and the
+    first sample_size rows, then rows are formatted lazily and
+    written in chunks of about buffer_size characters.
+
+    >>> stream_tableformat(([x, "a" * x] for x in range(5, 12, 3)), columns=["size", "value"], sample_size=2)
+    |size|value   |
+    |----|--------|
+    |5   |aaaaa   |
+    |8   |aaaaaaaa|
+    |11  |aaaaa...|
+    3
+    >>>
+    """
+
+    strings = iter(strings)
+    columns = None if columns is None else [str(x) for x in columns]
+    sample = [
+        [cell if isinstance(cell, str) else str(cell) for cell in row]
+        for row in islice(strings, sample_size)
+    ]
+
+    widths = [] if columns is None else [string_width(x) for x in columns]
+    for row in sample:
+        if len(row) > len(widths):
+            widths.extend(0 for _ in range(len(row) - len(widths)))
+        for index, cell in enumerate(row):
+            size = string_width(cell)
+            if size > widths[index]:
+                widths[index] = size
+
+    if not widths:
+        return 0
+
+    if max_width is not None:
+        widths = [min(width, max_width) for width in widths]
+
+    formatter = TableFormatter(columns, widths, end, separator)
+    format_row = formatter.format_row
+    write = (file or sys.stdout).write
+
+    buffer = [] if columns is None else [formatter.format_header()]
+    size = 0
+    counter = 0
+
+    for counter, row in enumerate(chain(sample, strings), 1):
+        line = format_row(row)
+        buffer.append(line)
+        size += len(line)
+
+        if size >= buffer_size:
+            buffer.append("")
+            write("\n".join(buffer))
+            buffer.clear()
+            size = 0
+
+    if buffer:
+        buffer.append("")
+        write("\n".join(buffer))
+
+    return counter
 
 
 class Object_StringF:
@@ -43,17 +43,58 @@ under certain conditions.
 __license__ = license
 __copyright__ = copyright
 
-__all__ = ["Terminal"]
+__all__ = ["Terminal", "TerminalBuffer", "Screen"]
 
+from asyncio import TimeoutError as AsyncTimeoutError
+from asyncio import get_running_loop, wait_for
+from typing import Tuple, TextIO, List, Union
+from selectors import DefaultSelector, EVENT_READ
 from sys import stdout, platform, stdin
+from time import perf_counter, sleep
 from collections.abc import Callable
-from typing import Tuple
+from re import compile as re_compile
+from functools import lru_cache
+from os import read, isatty
+from threading import local
 from enum import Enum
 
-stdout_write: Callable = stdout.write
-stdout_flush: Callable = stdout.flush
+try:
+    from termios import tcgetattr, tcsetattr, TCSADRAIN
+    from tty import setraw
+except ImportError:
+    TERMIOS = False
+    from msvcrt import kbhit, getch
+else:
+    TERMIOS = True
+
+terminal_write: Callable = stdout.write
+terminal_flush: Callable = stdout.flush
 char_ANSI: str = "\x1b["
 char_special_ANSI: str = "\x1b"
+batches = local()
+
+
+def stdout_write(data: str) -> int:
+    """
+    This function writes data in the innermost TerminalBuffer
+    used by the current thread, or in stdout.
+    """
+
+    buffers = getattr(batches, "buffers", None)
+    if buffers:
+        return buffers[-1].write(data)
+
+    return terminal_write(data)
+
+
+def stdout_flush() -> None:
+    """
+    This function flushes stdout when the current thread
+    does not use a TerminalBuffer.
+    """
+
+    if not getattr(batches, "buffers", None):
+        terminal_flush()
 
 
 class COLORS_MODES(Enum):
@@ -79,6 +120,343 @@ class COLORS(Enum):
 colors = COLORS._member_names_
 colors_map = COLORS._member_map_
 
+foreground_colors = {
+    (name, mode): f"{char_ANSI}{prefix.value}{color.value}"
+    for name, color in colors_map.items()
+    for mode, prefix in (
+        (1, COLORS_MODES.FGCOLOR1),
+        (2, COLORS_MODES.FGCOLOR2),
+    )
+}
+background_colors = {
+    (name, mode): f"{char_ANSI}{prefix.value}{color.value}"
+    for name, color in colors_map.items()
+    for mode, prefix in (
+        (1, COLORS_MODES.BGCOLOR1),
+        (2, COLORS_MODES.BGCOLOR2),
+    )
+}
+foreground_8bits = tuple(f"{char_ANSI}38;5;{color}m" for color in range(256))
+background_8bits = tuple(f"{char_ANSI}48;5;{color}m" for color in range(256))
+
+styles = {
+    "bold": "1",
+    "faint": "2",
+    "italic": "3",
+    "underline": "4",
+    "blink": "5",
+    "reverse": "7",
+    "hide": "8",
+    "strike": "9",
+}
+
+
+@lru_cache(maxsize=4096)
+def get_3bytes_sequence(mode: str, red: int, green: int, blue: int) -> str:
+    """
+    This function returns the escape sequence for a 24 bits color,
+    mode is "38" for foreground and "48" for background.
+    """
+
+    if (
+        red > 255
+        or red < 0
+        or green > 255
+        or green < 0
+        or blue > 255
+        or blue < 0
+    ):
+        raise ValueError(
+            f"colors ({red};{green};{blue}) should be in range of 0 to 255"
+        )
+
+    return f"{char_ANSI}{mode};2;{red};{green};{blue}m"
+
+
+def get_color_parameters(
+    color: Union[str, int, Tuple[int, int, int]], background: bool
+) -> str:
+    """
+    This function returns SGR parameters for a color name
+    (BRIGHT_ prefix for the second mode), a 8 bits color
+    or a 24 bits color (red, green, blue).
+    """
+
+    if isinstance(color, str):
+        name = color.upper()
+        mode = COLORS_MODES.BGCOLOR1 if background else COLORS_MODES.FGCOLOR1
+
+        if name.startswith("BRIGHT_"):
+            name = name[7:]
+            mode = (
+                COLORS_MODES.BGCOLOR2 if background else COLORS_MODES.FGCOLOR2
+            )
+
+        if name not in colors:
+            raise ValueError(f"color ({color}) should be in {colors}")
+
+        return mode.value + colors_map[name].value[:-1]
+
+    prefix = "48" if background else "38"
+
+    if isinstance(color, int):
+        if color > 255 or color < 0:
+            raise ValueError(f"color ({color}) should be in range of 0 to 255")
+        return f"{prefix};5;{color}"
+
+    return get_3bytes_sequence(prefix, *color)[2:-1]
+
+
+@lru_cache(maxsize=4096)
+def get_style(
+    fg: Union[str, int, Tuple[int, int, int]] = None,
+    bg: Union[str, int, Tuple[int, int, int]] = None,
+    **kwargs,
+) -> str:
+    """
+    This function returns one SGR escape sequence for colors
+    and styles (bold, faint, italic, underline, blink,
+    reverse, hide and strike).
+    """
+
+    parameters = []
+
+    for name, value in kwargs.items():
+        if name not in styles:
+            raise ValueError(f"style ({name}) should be in {list(styles)}")
+        if value:
+            parameters.append(styles[name])
+
+    if fg is not None:
+        parameters.append(get_color_parameters(fg, False))
+
+    if bg is not None:
+        parameters.append(get_color_parameters(bg, True))
+
+    return f"{char_ANSI}{';'.join(parameters) or '0'}m"
+
+
+cursor_position_report = re_compile(rb"\x1b\[\d+;\d+R")
+
+
+def parse_device_status_report(
+    data: bytes, start: int = 0
+) -> Tuple[bytes, bytes]:
+    """
+    This function searches a cursor position report in data from
+    start and returns (precedent, position) or None.
+    """
+
+    match = cursor_position_report.search(data, start)
+    if match is None:
+        return None
+
+    return data[: match.start()], match.group()
+
+
+def read_device_status_report(timeout: float = 1.0) -> Tuple[bytes, bytes]:
+    """
+    This function reports the cursor position in raw mode and
+    raises TimeoutError when the terminal does not answer
+    before timeout seconds (OSError when stdin is not a
+    terminal).
+    """
+
+    fd = stdin.fileno()
+    if not isatty(fd):
+        raise OSError("stdin is not a terminal")
+
+    deadline = perf_counter() + timeout
+    data = b""
+
+    if not TERMIOS:
+        stdout_write(f"{char_ANSI}6n")
+        stdout_flush()
+
+        while perf_counter() < deadline:
+            if not kbhit():
+                sleep(0.005)
+                continue
+
+            start = max(len(data) - 15, 0)
+            data += getch()
+            if report := parse_device_status_report(data, start):
+                return report
+
+        raise TimeoutError("the terminal does not report cursor position")
+
+    attributes = tcgetattr(fd)
+    setraw(fd)
+
+    try:
+        stdout_write(f"{char_ANSI}6n")
+        stdout_flush()
+
+        with DefaultSelector() as selector:
+            selector.register(fd, EVENT_READ)
+
+            while (remaining := deadline - perf_counter()) > 0:
+                if not selector.select(remaining):
+                    break
+
+                start = max(len(data) - 15, 0)
+                data += read(fd, 1024)
+                if report := parse_device_status_report(data, start):
+                    return report
+    finally:
+        tcsetattr(fd, TCSADRAIN, attributes)
+
+    raise TimeoutError("the terminal does not report cursor position")
+
+
+async def async_read_device_status_report(
+    timeout: float = 1.0,
+) -> Tuple[bytes, bytes]:
+    """
+    This coroutine reports the cursor position in raw mode and
+    raises TimeoutError when the terminal does not answer
+    before timeout seconds (OSError when stdin is not a
+    terminal).
+    """
+
+    loop = get_running_loop()
+
+    if not TERMIOS:
+        return await loop.run_in_executor(
+            None, read_device_status_report, timeout
+        )
+
+    fd = stdin.fileno()
+    if not isatty(fd):
+        raise OSError("stdin is not a terminal")
+
+    future = loop.create_future()
+    data = bytearray()
+
+    def reader() -> None:
+        start = max(len(data) - 15, 0)
+        data.extend(read(fd, 1024))
+        report = parse_device_status_report(data, start)
+        if report and not future.done():
+            future.set_result((bytes(report[0]), bytes(report[1])))
+
+    attributes = tcgetattr(fd)
+    setraw(fd)
+    loop.add_reader(fd, reader)
+
+    try:
+        stdout_write(f"{char_ANSI}6n")
+        stdout_flush()
+        return await wait_for(future, timeout)
+    except AsyncTimeoutError:
+        raise TimeoutError(
+            "the terminal does not report cursor position"
+        ) from None
+    finally:
+        loop.remove_reader(fd)
+        tcsetattr(fd, TCSADRAIN, attributes)
+
+
+def no_flush() -> None:
+    """
+    This function replaces stdout_flush in batch mode.
+    """
+
+    return None
+
+
+class TerminalBuffer:
+
+    """
+    This class collects escape sequences and text written by
+    Terminal functions and writes them with one write and one
+    flush on exit. fps limits the number of frames per second.
+
+    Terminal functions called by the thread using the buffer as
+    context manager write in the buffer, other threads are not
+    captured. Buffers can be nested in a thread: the inner buffer
+    is written in the outer buffer on exit.
+
+    >>> from io import StringIO
+    >>> file = StringIO()
+    >>> with TerminalBuffer(file) as buffer:
+    ...     Terminal.bold()
+    ...     buffer.write("text")
+    ...     Terminal.reset()
+    ...
+    4
+    >>> file.getvalue()
+    '\\x1b[1mtext\\x1b[0m'
+    >>> file = StringIO()
+    >>> with TerminalBuffer(file):
+    ...     with TerminalBuffer():
+    ...         Terminal.bold()
+    ...     Terminal.reset()
+    ...
+    >>> file.getvalue()
+    '\\x1b[1m\\x1b[0m'
+    >>>
+    """
+
+    def __init__(self, file: TextIO = None, fps: float = None):
+        self.file = file
+        self.interval = 1 / fps if fps else 0
+        self.last_emit = 0
+        self.buffer = []
+        self.previous = None
+
+    def write(self, data: str) -> int:
+        """
+        This function adds text in the buffer.
+        """
+
+        self.buffer.append(data)
+        return len(data)
+
+    def emit(self) -> None:
+        """
+        This function writes and flushes the buffer content.
+        """
+
+        buffer = self.buffer
+        if not buffer:
+            return None
+
+        if self.interval:
+            wait = self.last_emit + self.interval - perf_counter()
+            if wait > 0:
+                sleep(wait)
+
+        data = "".join(buffer)
+        buffer.clear()
+
+        if self.file is None:
+            write, flush = self.previous or (terminal_write, terminal_flush)
+        else:
+            write, flush = self.file.write, self.file.flush
+
+        write(data)
+        flush()
+        self.last_emit = perf_counter()
+
+    def __enter__(self) -> "TerminalBuffer":
+        buffers = getattr(batches, "buffers", None)
+        if buffers is None:
+            buffers = batches.buffers = []
+
+        self.previous = (
+            (buffers[-1].write, no_flush)
+            if buffers
+            else (terminal_write, terminal_flush)
+        )
+        buffers.append(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        batches.buffers.remove(self)
+        self.emit()
+        self.previous = None
+
 
 class Terminal:
 
@@ -87,6 +465,14 @@ class Terminal:
     characters.
     """
 
+    def batch(file: TextIO = None, fps: float = None) -> TerminalBuffer:
+        """
+        This function returns a context manager to write
+        all escape sequences with one write and one flush.
+        """
+
+        return TerminalBuffer(file, fps)
+
     #############
     #  \x0X
     #############
@@ -283,11 +669,19 @@ class Terminal:
         stdout_write(f"{char_ANSI}{line};{position}f")
         stdout_flush()
 
-    def device_status_report() -> Tuple[bytes, bytes]:
+    def device_status_report(timeout: float = None) -> Tuple[bytes, bytes]:
         """
         This function reports the cursor position.
+
+        When timeout is not None, the terminal is read in raw mode
+        without blocking and TimeoutError is raised if it does not
+        answer before timeout seconds (OSError if stdin is not a
+        terminal).
         """
 
+        if timeout is not None:
+            return read_device_status_report(timeout)
+
         stdout_write(f"{char_ANSI}6n")
         stdout_flush()
 
@@ -310,6 +704,17 @@ class Terminal:
 
         return precedent, position
 
+    async def async_device_status_report(
+        timeout: float = 1.0,
+    ) -> Tuple[bytes, bytes]:
+        """
+        This coroutine reports the cursor position and raises
+        TimeoutError if the terminal does not answer before
+        timeout seconds (OSError if stdin is not a terminal).
+        """
+
+        return await async_read_device_status_report(timeout)
+
     def save_current_cursor_position() -> None:
         """
         This function save the cursor position.
@@ -502,12 +907,7 @@ class Terminal:
         using the 3 bytes mode.
         """
 
-        if red > 255 or green > 255 or blue > 255:
-            raise ValueError(
-                f"colors ({red};{green};{blue}) should be in range of 0 to 255"
-            )
-
-        stdout_write(f"{char_ANSI}38;2;{red};{green};{blue}m")
+        stdout_write(get_3bytes_sequence("38", red, green, blue))
         stdout_flush()
 
     def change_foreground_color_8bits(color: int) -> None:
@@ -529,7 +929,7 @@ class Terminal:
         if color > 255 or color < 0:
             raise ValueError(f"color ({color}) should be in range of 0 to 255")
 
-        stdout_write(f"{char_ANSI}38;5;{color}")
+        stdout_write(foreground_8bits[color])
         stdout_flush()
 
     def change_background_color_3bytes(
@@ -540,19 +940,7 @@ class Terminal:
         using the 3 bytes mode.
         """
 
-        if (
-            red > 255
-            or red < 0
-            or green > 255
-            or green < 0
-            or blue > 255
-            or blue < 0
-        ):
-            raise ValueError(
-                f"colors ({red};{green};{blue}) should be in range of 0 to 255"
-            )
-
-        stdout_write(f"{char_ANSI}48;2;{red};{green};{blue}m")
+        stdout_write(get_3bytes_sequence("48", red, green, blue))
         stdout_flush()
 
     def change_background_color_8bits(color: int) -> None:
@@ -564,7 +952,7 @@ class Terminal:
         if color > 255 or color < 0:
             raise ValueError(f"color ({color}) should be in range of 0 to 255")
 
-        stdout_write(f"{char_ANSI}48;5;{color}")
+        stdout_write(background_8bits[color])
         stdout_flush()
 
     def change_foreground_color(color: str, mode: int = 1) -> None:
@@ -572,21 +960,14 @@ class Terminal:
         This function changes foreground color.
         """
 
-        color = color.upper()
+        sequence = foreground_colors.get((color.upper(), mode))
 
-        if mode == 1:
-            mode = COLORS_MODES.FGCOLOR1.value
-        elif mode == 2:
-            mode = COLORS_MODES.FGCOLOR2.value
-        else:
-            raise ValueError(f"mode ({mode}) sould be 1 or 2")
-
-        if color not in colors:
-            raise ValueError(f"color ({color}) should be in {colors}")
+        if sequence is None:
+            if mode != 1 and mode != 2:
+                raise ValueError(f"mode ({mode}) sould be 1 or 2")
+            raise ValueError(f"color ({color.upper()}) should be in {colors}")
 
-        color = colors_map[color].value
-
-        stdout_write(f"{char_ANSI}{mode}{color}")
+        stdout_write(sequence)
         stdout_flush()
 
     def change_background_color(color: str, mode: int = 1) -> None:
@@ -594,22 +975,33 @@ class Terminal:
         This function changes background color.
         """
 
-        color = color.upper()
+        sequence = background_colors.get((color.upper(), mode))
 
-        if mode == 1:
-            mode = COLORS_MODES.BGCOLOR1.value
-        elif mode == 2:
-            mode = COLORS_MODES.BGCOLOR2.value
-        else:
-            raise ValueError(f"mode ({mode}) sould be 1 or 2")
+        if sequence is None:
+            if mode != 1 and mode != 2:
+                raise ValueError(f"mode ({mode}) sould be 1 or 2")
+            raise ValueError(f"color ({color.upper()}) should be in {colors}")
 
-        if color not in colors:
-            raise ValueError(f"color ({color}) should be in {colors}")
+        stdout_write(sequence)
+        stdout_flush()
 
-        color = colors_map[color].value
+    def style(
+        fg: Union[str, int, Tuple[int, int, int]] = None,
+        bg: Union[str, int, Tuple[int, int, int]] = None,
+        **kwargs,
+    ) -> str:
+        """
+        This function returns one SGR escape sequence for colors
+        (name, 8 bits color or (red, green, blue)) and styles.
 
-        stdout_write(f"{char_ANSI}{mode}{color}")
-        stdout_flush()
+        >>> Terminal.style(fg="red", bg=(0, 0, 255), bold=True)
+        '\\x1b[1;31;48;2;0;0;255m'
+        >>> Terminal.style(fg="bright_green", underline=True)
+        '\\x1b[4;92m'
+        >>>
+        """
+
+        return get_style(fg, bg, **kwargs)
 
     def reset_background() -> None:
         """
@@ -628,6 +1020,155 @@ class Terminal:
         stdout_flush()
 
 
+class Screen:
+
+    """
+    This class implements a double-buffered screen: a grid of
+    (character, SGR escape sequences) cells and the previous
+    frame. render writes only the changed cells with the minimal
+    cursor moves, using one write.
+
+    >>> from io import StringIO
+    >>> file = StringIO()
+    >>> screen = Screen(2, 6, file)
+    >>> screen.write(0, 0, "status")
+    >>> screen.render()
+    >>> screen.write(1, 2, "ok", "\\x1b[32m")
+    >>> screen.file = file = StringIO()
+    >>> screen.render()
+    >>> file.getvalue()
+    '\\x1b[2;3H\\x1b[0m\\x1b[32mok\\x1b[0m'
+    >>>
+    """
+
+    blank: Tuple[str, str] = (" ", "")
+
+    def __init__(self, lines: int, columns: int, file: TextIO = None):
+        self.file = file
+        self.resize(lines, columns)
+
+    def resize(self, lines: int, columns: int) -> None:
+        """
+        This function resizes and clears the screen,
+        the next render draws all cells.
+        """
+
+        self.lines = lines
+        self.columns = columns
+        self.current = [[self.blank] * columns for _ in range(lines)]
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """
+        This function forgets the previous frame,
+        the next render draws all cells.
+        """
+
+        self.previous = [[None] * self.columns for _ in range(self.lines)]
+
+    def clear(self) -> None:
+        """
+        This function clears the current frame.
+        """
+
+        blank = self.blank
+        for line in self.current:
+            line[:] = [blank] * self.columns
+
+    def write(self, line: int, column: int, text: str, sgr: str = "") -> None:
+        """
+        This function writes text (single width characters)
+        in the current frame, sgr is the escape sequences
+        for graphic attributes (colors, bold...). Text outside
+        the screen is clipped.
+
+        >>> screen = Screen(1, 4)
+        >>> screen.write(0, -2, "abcd")
+        >>> screen.write(0, 3, "xyz")
+        >>> screen.write(0, 4, "out")
+        >>> "".join(cell[0] for cell in screen.current[0])
+        'cd x'
+        >>>
+        """
+
+        if line < 0 or line >= self.lines or column >= self.columns:
+            return None
+
+        if column < 0:
+            text = text[-column:]
+            column = 0
+
+        text = text[: self.columns - column]
+        self.current[line][column : column + len(text)] = [
+            (character, sgr) for character in text
+        ]
+
+    def get_changes(self) -> List[Tuple[int, int, List[Tuple[str, str]]]]:
+        """
+        This function returns runs of changed cells
+        as (line, column, cells).
+        """
+
+        changes = []
+
+        for y, (line, previous) in enumerate(zip(self.current, self.previous)):
+            if line == previous:
+                continue
+
+            run = None
+            for x, (cell, old) in enumerate(zip(line, previous)):
+                if cell != old:
+                    if run is None:
+                        run = []
+                        changes.append((y, x, run))
+                    run.append(cell)
+                else:
+                    run = None
+
+        return changes
+
+    def render(self) -> None:
+        """
+        This function writes the changes from the previous frame.
+        """
+
+        changes = self.get_changes()
+        if not changes:
+            return None
+
+        columns = self.columns
+        cursor = None
+        current_sgr = ""
+
+        with Terminal.batch(self.file) as buffer:
+            write = buffer.write
+
+            for y, x, run in changes:
+                if cursor is not None and cursor[0] == y:
+                    gap = x - cursor[1]
+                    between = self.current[y][cursor[1] : x]
+                    if gap <= 4 and all(c[1] == current_sgr for c in between):
+                        write("".join(c[0] for c in between))
+                    else:
+                        Terminal.cursor_forward(gap)
+                else:
+                    Terminal.cursor_position(y + 1, x + 1)
+
+                for character, sgr in run:
+                    if sgr != current_sgr:
+                        write(f"{char_ANSI}0m{sgr}")
+                        current_sgr = sgr
+                    write(character)
+
+                end = x + len(run)
+                cursor = (y, end) if end < columns else None
+
+            if current_sgr:
+                write(f"{char_ANSI}0m")
+
+        self.previous = [line.copy() for line in self.current]
+
+
 if platform == "win32":
 
     class Terminal(Terminal):